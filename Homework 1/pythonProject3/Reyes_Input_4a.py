@@ -1,35 +1,14 @@
-import string
+# Caesar Cipher, part A
+#
+# The implementation now lives in the cipher package (cipher/caesar.py); this script keeps
+# running the homework from this directory the same way as before.
 
+import os
+import sys
 
-# Function that encrypts/decrypts a given text using the Caesar Cipher
-def caesar_cipher(text, key, mode="encrypt"):
-    """
-    Parameters:
-    - text (str): The input text to encrypt or decrypt.
-    - key (int): The shift key for the Caesar cipher.
-    - mode (str): Either "encrypt" or "decrypt". Defaults to "encrypt".
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
 
-    Returns:
-    - str: The encrypted or decrypted text.
-    """
-    result = []
-
-    # Normalize key for decryption
-    if mode == "decrypt":
-        key = -key
-
-    # For every character in the given text
-    for char in text:
-        # Ignore non-letter symbols, if present
-        if char.isalpha():  # Ignore non-letter symbols
-            base = ord('A') if char.isupper() else ord('a')
-            shifted = (ord(char) - base + key) % 26 + base
-            result.append(chr(shifted))
-        # Ignore non-alphabetic characters, if present
-        else:
-            result.append(char)
-
-    return ''.join(result)
+from cipher.caesar import caesar_cipher  # noqa: E402
 
 
 # Example usage for part A
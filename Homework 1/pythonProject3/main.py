@@ -1,76 +1,14 @@
-import numpy as np
-from sympy import Matrix
+# Hill Cipher
+#
+# The implementation now lives in the cipher package (cipher/hill.py); this script keeps
+# running the homework from this directory the same way as before.
 
+import os
+import sys
 
-# Function that converts text to numbers while ignoring non-alphabet characters
-def text_to_numbers(text):
-    text = text.upper()
-    positions = {i: char for i, char in enumerate(text) if char == ' '}  # Store space positions
-    text = ''.join(filter(str.isalpha, text))  # Remove spaces and non-alphabet characters
-    return [ord(char) - ord('A') for char in text], positions
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".."))
 
-
-# Function that converts numbers back to text
-def numbers_to_text(numbers, positions):
-    text = ''.join(chr(num + ord('A')) for num in numbers)
-    for pos, char in positions.items():
-        text = text[:pos] + char + text[pos:]  # Reinsert spaces
-    return text
-
-
-# Function that finds the modular inverse of a matrix under modulo m
-def mod_inv(matrix, m):
-    det = int(np.round(np.linalg.det(matrix)))  # Determinant of the matrix
-    det = det % m  # Ensure determinant is within mod 26 range
-    if np.gcd(det, m) != 1:
-        raise ValueError(f"Key matrix determinant ({det}) is not invertible modulo {m}. Choose a different key matrix.")
-
-    matrix_mod_inv = Matrix(matrix).inv_mod(m)  # Use sympy for modular inverse
-    return np.array(matrix_mod_inv).astype(int)  # Convert to numpy array
-
-
-# Function that converts a key string into a square matrix for Hill Cipher
-def key_string_to_matrix(key_string):
-    key_numbers = [ord(char.upper()) - ord('A') for char in key_string]
-    size = int(len(key_numbers) ** 0.5)  # Determine matrix size
-    return np.array(key_numbers).reshape(size, size)  # Reshape into a square matrix
-
-
-# Function that encrypts the message using Hill Cipher
-def encrypt(message, key_matrix):
-    message_numbers, positions = text_to_numbers(message)
-    block_size = key_matrix.shape[0]
-
-    # Pad message (with 'X') if necessary
-    while len(message_numbers) % block_size != 0:
-        message_numbers.append(ord('X') - ord('A'))
-
-    # Encrypt the message in blocks
-    encrypted_numbers = []
-    for i in range(0, len(message_numbers), block_size):
-        block = np.array(message_numbers[i:i + block_size])
-        encrypted_block = np.dot(key_matrix, block) % 26
-        encrypted_numbers.extend(encrypted_block)
-
-    return numbers_to_text(encrypted_numbers, {}), positions
-
-
-# Function that decrypt the message using Hill Cipher
-def decrypt(encrypted_message, key_matrix):
-    encrypted_numbers = text_to_numbers(encrypted_message)
-    block_size = key_matrix.shape[0]
-
-    # Calculate the modular inverse of the key matrix
-    inv_key_matrix = mod_inv(key_matrix, 26)
-
-    # Decrypt the message in blocks
-    decrypted_numbers = []
-    for i in range(0, len(encrypted_numbers), block_size):
-        block = np.array(encrypted_numbers[i:i + block_size])
-        decrypted_block = np.dot(inv_key_matrix, block) % 26
-        decrypted_numbers.extend(decrypted_block)
-
-    return numbers_to_text(decrypted_numbers)
+from cipher.hill import decrypt, encrypt, key_string_to_matrix  # noqa: E402
 
 
 # Function that reads in input, decrypts the message, and writes plaintext to a file
@@ -86,13 +24,17 @@ def process_test_files(filename, output_filename):
     key_matrix = key_string_to_matrix(key_string)
 
     # Encrypt the message
-    encrypted_text, num_of_spaces = encrypt(message, key_matrix)
+    encrypted_text, positions = encrypt(message, key_matrix)
     with open(output_filename, 'w') as enc_file:
         enc_file.write(encrypted_text)
     print("Encrypted Message:", encrypted_text)
 
-    # Decrypt the message
-    decrypted_text = decrypt(encrypted_text, key_matrix)
+    # Decrypt the message (the key must be invertible modulo 26)
+    try:
+        decrypted_text = decrypt(encrypted_text, key_matrix, positions)
+    except ValueError as e:
+        print("Decryption failed!", e)
+        return
     print("Decrypted Message:", decrypted_text)
 
     # Verify decryption is correct
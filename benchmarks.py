@@ -0,0 +1,322 @@
+# Benchmark harness for the cipher and field code in every homework
+#
+# Each case runs across a range of input sizes and reports throughput, latency
+# percentiles and peak memory. Results are written as JSON, and a previous results
+# file can be passed as a baseline so slower cases are flagged as regressions.
+# Calls shorter than MIN_SAMPLE_TIME are timed in batches so tiny inputs give stable numbers.
+# The start-up time of the cipher command is checked against COLD_START_BUDGET.
+#
+#   python benchmarks.py --sizes 1K,1M,64M --output results.json
+#   python benchmarks.py --baseline results.json --only caesar,hill
+
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import namedtuple
+
+import numpy as np
+
+from cipher import caesar, euclid, gf256, gf_bulk, hill
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+# Default input sizes in bytes, bit lengths for the Euclid operands and key sizes for Hill
+DEFAULT_SIZES = "16,1K,64K,1M,16M"
+DEFAULT_BITS = "64,256,1024,4096,16384"
+DEFAULT_HILL_KEYS = "2,3,4,8,16"
+
+# Each size is run at least once, then repeated until REPEAT runs or TIME_BUDGET seconds
+REPEAT = 25
+TIME_BUDGET = 2.0
+
+# Calls that finish faster than this are timed in batches, so each sample lasts at least this long
+# and timer resolution and scheduling jitter do not swamp microsecond-sized cases
+MIN_SAMPLE_TIME = 0.005
+
+# A case is a regression when its median latency grows by more than this fraction
+# and by more than REGRESSION_FLOOR seconds per call (smaller changes are timer noise)
+REGRESSION_THRESHOLD = 0.10
+REGRESSION_FLOOR = 5e-6
+
+# Longest acceptable median wall time, in seconds, for a small Caesar job run through `python -m cipher`
+COLD_START_BUDGET = 0.1
+COLD_START_COMMAND = ["-m", "cipher", "encrypt", "caesar", "--key", "3", "--text", "Hello, World!"]
+
+# setup(size) builds the inputs and returns a no-argument callable that does the measured work.
+# unit is what `size` counts; max_size skips sizes where a pure-Python loop would take minutes.
+Case = namedtuple("Case", ["name", "unit", "setup", "sizes", "max_size"])
+
+
+# Function that parses a comma-separated list of sizes such as "16,1K,64M"
+def parse_sizes(text):
+    sizes = []
+    for item in text.split(","):
+        item = item.strip().upper()
+        scale = SIZE_SUFFIXES.get(item[-1:], 1)
+        sizes.append(int(item[:-1] if scale > 1 else item) * scale)
+    return sizes
+
+
+# Function that formats a size the same way parse_sizes reads it
+def format_size(size):
+    for suffix, scale in sorted(SIZE_SUFFIXES.items(), key=lambda entry: -entry[1]):
+        if size >= scale and size % scale == 0:
+            return f"{size // scale}{suffix}"
+    return str(size)
+
+
+# Function that makes ASCII text of the given length with letters, spaces and some punctuation
+def random_text(size, seed=0):
+    rng = np.random.default_rng(seed)
+    alphabet = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz     .,", dtype=np.uint8)
+    return alphabet[rng.integers(0, len(alphabet), size)].tobytes().decode('ascii')
+
+
+# Function that makes a random k x k key matrix that is invertible modulo 26
+def random_hill_key(k, seed=0):
+    rng = np.random.default_rng(seed)
+    while True:
+        matrix = rng.integers(0, 26, (k, k))
+        try:
+            hill.mod_inv(matrix, 26)
+            return matrix
+        except ValueError:
+            continue
+
+
+# Function that builds the list of benchmark cases
+def build_cases(sizes, bits, hill_keys):
+    # Generated GF input files live here until the interpreter exits
+    workdir = tempfile.TemporaryDirectory(prefix="cipher_bench_")
+
+    def caesar_case(size):
+        text = random_text(size)
+        return lambda: caesar.caesar_cipher(text, 3)
+
+    def hill_encrypt_case(k):
+        def setup(size):
+            text, key = random_text(size), random_hill_key(k)
+            return lambda: hill.encrypt(text, key)
+        return setup
+
+    def hill_decrypt_case(k):
+        def setup(size):
+            key = random_hill_key(k)
+            encrypted, positions = hill.encrypt(random_text(size), key)
+            return lambda: hill.decrypt(encrypted, key, positions)
+        return setup
+
+    def mod_inv_case(size):
+        matrix = random_hill_key(size)
+        return lambda: hill.mod_inv(matrix, 26)
+
+    def euclid_case(fast):
+        def setup(size):
+            rng = random.Random(size)
+            a, b = rng.getrandbits(size) | 1, rng.getrandbits(size) | (1 << (size - 1))
+            return lambda: euclid.extended_euclidean(a, b, fast=fast, trace=False)
+        return setup
+
+    def gf_pairs(size, nonzero_b=False):
+        rng = np.random.default_rng(size)
+        a = rng.integers(0, 256, size).tolist()
+        b = rng.integers(1 if nonzero_b else 0, 256, size).tolist()
+        return a, b
+
+    def multiply_case(size):
+        a, b = gf_pairs(size)
+        return lambda: [gf256.multiply_GF(x, y) for x, y in zip(a, b)]
+
+    def inverse_case(size):
+        _, b = gf_pairs(size, nonzero_b=True)
+        return lambda: [gf256.inverse_GF(y) for y in b]
+
+    def divide_case(size):
+        a, b = gf_pairs(size, nonzero_b=True)
+        return lambda: [gf256.divide_GF(x, y) for x, y in zip(a, b)]
+
+    def process_files_case(process):
+        def setup(size):
+            # The input file is written once per size and reused by every repeat
+            input_path = os.path.join(workdir.name, f"input_{size}.txt")
+            output_path = os.path.join(workdir.name, "output.txt")
+            rng = np.random.default_rng(size)
+            lines = max(1, size // 20)
+            a, b = rng.integers(0, 256, lines), rng.integers(0, 256, lines)
+            ops = rng.choice(list("+-*/"), lines)
+            with open(input_path, "w") as file:
+                file.writelines(f"{x:08b} {y:08b} {op}\n" for x, y, op in zip(a, b, ops))
+            return lambda: process(input_path, output_path)
+        return setup
+
+    # A fresh interpreter per run, so this includes Python start-up and every import the CLI does
+    def cold_start_case(size):
+        command = [sys.executable] + COLD_START_COMMAND
+        return lambda: subprocess.run(command, cwd=ROOT, check=True, stdout=subprocess.DEVNULL)
+
+    cases = [Case("cipher.cold_start", "runs", cold_start_case, [1], None),
+             Case("caesar_cipher", "bytes", caesar_case, sizes, None)]
+    for k in hill_keys:
+        cases.append(Case(f"hill.encrypt[k={k}]", "bytes", hill_encrypt_case(k), sizes, None))
+        cases.append(Case(f"hill.decrypt[k={k}]", "bytes", hill_decrypt_case(k), sizes, None))
+    cases += [
+        Case("hill.mod_inv", "key size", mod_inv_case, list(range(2, 17)), None),
+        Case("extended_euclidean", "bits", euclid_case(False), bits, None),
+        Case("extended_euclidean[fast]", "bits", euclid_case(True), bits, None),
+        Case("multiply_GF", "ops", multiply_case, sizes, 1 << 20),
+        Case("inverse_GF", "ops", inverse_case, sizes, 1 << 20),
+        Case("divide_GF", "ops", divide_case, sizes, 1 << 20),
+        Case("process_files", "bytes", process_files_case(gf256.process_files), sizes, 16 << 20),
+        Case("process_files_bulk", "bytes", process_files_case(gf_bulk.process_files_bulk), sizes, None),
+    ]
+    return cases
+
+
+# Function that returns how many calls of run make one sample of at least MIN_SAMPLE_TIME seconds
+def calls_per_sample(run):
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SAMPLE_TIME:
+            return calls
+        calls = max(calls * 2, int(calls * MIN_SAMPLE_TIME / max(elapsed, 1e-9) * 1.2))
+
+
+# Function that times one case at one size; peak memory comes from a separate traced run.
+# Each sample is the time per call of a batch of calls, see MIN_SAMPLE_TIME.
+def measure(run, repeat, time_budget):
+    calls = calls_per_sample(run)
+    samples = []
+    started = time.perf_counter()
+    while not samples or (len(samples) < repeat and time.perf_counter() - started < time_budget):
+        start = time.perf_counter()
+        for _ in range(calls):
+            run()
+        samples.append((time.perf_counter() - start) / calls)
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return samples, calls, peak
+
+
+# Function that summarises the timings of one case at one size
+def summarise(case, size, samples, calls, peak):
+    p50, p90, p99 = np.percentile(samples, [50, 90, 99]).tolist()
+    # Throughput counts the input size; for bit lengths and key sizes it is calls per second
+    work = size if case.unit in ("bytes", "ops") else 1
+    return {
+        "name": case.name,
+        "size": size,
+        "unit": case.unit,
+        "samples": len(samples),
+        "calls_per_sample": calls,
+        "mean": sum(samples) / len(samples),
+        "p50": p50,
+        "p90": p90,
+        "p99": p99,
+        "throughput": work / p50 if p50 else None,
+        "peak_memory": peak,
+    }
+
+
+# Function that runs every selected case and prints one line per size
+def run_cases(cases, only, repeat, time_budget):
+    results = []
+    for case in cases:
+        if only and not any(case.name.startswith(prefix) for prefix in only):
+            continue
+        for size in case.sizes:
+            if case.max_size is not None and size > case.max_size:
+                continue
+            samples, calls, peak = measure(case.setup(size), repeat, time_budget)
+            result = summarise(case, size, samples, calls, peak)
+            results.append(result)
+
+            rate = result["throughput"]
+            rate_text = (f"{rate / 1e6:10.2f} MB/s" if case.unit == "bytes" else
+                         f"{rate / 1e6:10.2f} Mop/s" if case.unit == "ops" else f"{rate:10.1f} call/s")
+            print(f"{case.name:28} {format_size(size):>6} {case.unit:8} p50 {result['p50'] * 1e3:10.3f} ms  "
+                  f"p99 {result['p99'] * 1e3:10.3f} ms  {rate_text}  peak {result['peak_memory'] / 2**20:8.1f} MiB")
+    return results
+
+
+# Function that compares results with a baseline file; returns the regressed entries
+def compare(results, baseline_path, threshold, floor=REGRESSION_FLOOR):
+    with open(baseline_path) as file:
+        baseline = {(entry["name"], entry["size"]): entry for entry in json.load(file)["results"]}
+
+    regressions = []
+    for result in results:
+        # Process start-up varies by about 20% between runs; COLD_START_BUDGET checks it instead
+        if result["name"] == "cipher.cold_start":
+            continue
+        previous = baseline.get((result["name"], result["size"]))
+        if previous is None or not previous["p50"]:
+            continue
+        change = result["p50"] / previous["p50"] - 1
+        if change > threshold and result["p50"] - previous["p50"] > floor:
+            regressions.append((result, change))
+            print(f"REGRESSION {result['name']} @ {format_size(result['size'])}: "
+                  f"p50 {previous['p50'] * 1e3:.3f} ms -> {result['p50'] * 1e3:.3f} ms ({change:+.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the cipher and field code across input sizes.")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="input sizes in bytes, e.g. 16,1K,64M,256M")
+    parser.add_argument("--bits", default=DEFAULT_BITS, help="operand bit lengths for extended_euclidean")
+    parser.add_argument("--hill-keys", default=DEFAULT_HILL_KEYS, help="Hill key sizes for encrypt/decrypt")
+    parser.add_argument("--only", help="comma-separated case name prefixes to run")
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--time-budget", type=float, default=TIME_BUDGET, help="seconds per case and size")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="results file to compare against")
+    parser.add_argument("--threshold", type=float, default=REGRESSION_THRESHOLD)
+    parser.add_argument("--floor", type=float, default=REGRESSION_FLOOR,
+                        help="ignore p50 increases smaller than this many seconds per call")
+    args = parser.parse_args()
+
+    cases = build_cases(parse_sizes(args.sizes), [int(bits) for bits in args.bits.split(",")],
+                        [int(k) for k in args.hill_keys.split(",")])
+    only = args.only.split(",") if args.only else None
+    results = run_cases(cases, only, args.repeat, args.time_budget)
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "results": results,
+    }
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+    print(f"Wrote {len(results)} results to {args.output}")
+
+    failed = False
+    for result in results:
+        if result["name"] == "cipher.cold_start" and result["p50"] > COLD_START_BUDGET:
+            print(f"OVER BUDGET cipher.cold_start: p50 {result['p50'] * 1e3:.1f} ms > {COLD_START_BUDGET * 1e3:.0f} ms")
+            failed = True
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.threshold, args.floor)
+        print(f"{len(regressions)} regression(s) against {args.baseline}")
+        failed = failed or bool(regressions)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,21 @@
+# Classical ciphers and GF(2^8) arithmetic from the CS4920 homeworks.
+#
+# Submodules are loaded on first use (cipher.caesar, cipher.hill, ...), so importing the
+# package, or running a Caesar job from the command line, never imports NumPy.
+
+import importlib
+
+__all__ = ["caesar", "hill", "euclid", "gf256"]
+
+SUBMODULES = {
+    "caesar", "hill", "euclid", "gf256",
+    "letter_codec", "stream_cipher", "hill_attack", "gf_bulk", "galois_field", "gf_matrix", "aes", "shamir",
+    "homework",
+}
+
+
+# Function that imports a submodule the first time it is accessed as an attribute of the package
+def __getattr__(name):
+    if name in SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
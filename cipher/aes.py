@@ -0,0 +1,193 @@
+import time
+
+import numpy as np
+
+from .gf256 import inverse_GF, multiply_GF
+
+# Blocks encrypted per NumPy pass, which bounds the size of the intermediate arrays
+BLOCK_CHUNK = 1 << 16
+
+# Round constants for the AES-128 key schedule
+ROUND_CONSTANTS = [0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1b, 0x36]
+
+
+# Function that rotates an 8-bit value left by the given number of bits
+def rotate_left_8(value, bits):
+    return ((value << bits) | (value >> (8 - bits))) & 0xFF
+
+
+# Function that derives the AES S-box from the GF(2^8) inverse followed by the affine map
+def build_sbox():
+    sbox = []
+    for a in range(256):
+        s = inverse_GF(a) if a else 0
+        sbox.append(s ^ rotate_left_8(s, 1) ^ rotate_left_8(s, 2) ^ rotate_left_8(s, 3) ^ rotate_left_8(s, 4) ^ 0x63)
+    return sbox
+
+
+# Function that builds the four T-tables combining SubBytes, ShiftRows and MixColumns for one byte.
+# Column words are big-endian: the byte in row 0 is the most significant.
+def build_t_tables(sbox):
+    t0 = []
+    for a in range(256):
+        s = sbox[a]
+        t0.append((multiply_GF(s, 2) << 24) | (s << 16) | (s << 8) | multiply_GF(s, 3))
+
+    t0 = np.array(t0, dtype=np.uint32)
+    rotate_right = lambda words, bits: (words >> np.uint32(bits)) | (words << np.uint32(32 - bits))
+    return t0, rotate_right(t0, 8), rotate_right(t0, 16), rotate_right(t0, 24)
+
+
+# Tables built once when the module is loaded
+SBOX_LIST = build_sbox()
+SBOX = np.array(SBOX_LIST, dtype=np.uint8)
+T0, T1, T2, T3 = build_t_tables(SBOX_LIST)
+
+# State byte 4*c + r is row r of column c; after ShiftRows, column c row r comes from column c + r
+SHIFT_ROWS = np.array([4 * ((c + r) % 4) + r for c in range(4) for r in range(4)])
+ROW_SOURCES = [SHIFT_ROWS[r::4] for r in range(4)]  # Bytes feeding T_r for output columns 0-3
+
+
+# Function that expands a 16-byte key into the 11 AES-128 round keys (as an (11, 16) byte array)
+def expand_key(key):
+    key = bytes(key)
+    if len(key) != 16:
+        raise ValueError(f"AES-128 needs a 16-byte key, got {len(key)} bytes")
+
+    words = [list(key[i:i + 4]) for i in range(0, 16, 4)]
+    for i in range(4, 44):
+        word = list(words[i - 1])
+        if i % 4 == 0:
+            word = word[1:] + word[:1]  # RotWord
+            word = [SBOX_LIST[b] for b in word]  # SubWord
+            word[0] ^= ROUND_CONSTANTS[i // 4 - 1]
+        words.append([a ^ b for a, b in zip(words[i - 4], word)])
+
+    return np.array(words, dtype=np.uint8).reshape(11, 16)
+
+
+# Function that encrypts an (n, 16) array of blocks with the expanded round keys
+def encrypt_blocks(blocks, round_keys):
+    round_words = round_keys.reshape(11, 4, 4).astype(np.uint32)
+    round_words = (round_words[..., 0] << 24) | (round_words[..., 1] << 16) | (round_words[..., 2] << 8) | round_words[..., 3]
+
+    output = np.empty_like(blocks)
+    for start in range(0, len(blocks), BLOCK_CHUNK):
+        state = blocks[start:start + BLOCK_CHUNK] ^ round_keys[0]
+        for round_number in range(1, 10):
+            # One gather per T-table across every block and column at once
+            words = (T0[state[:, ROW_SOURCES[0]]] ^ T1[state[:, ROW_SOURCES[1]]]
+                     ^ T2[state[:, ROW_SOURCES[2]]] ^ T3[state[:, ROW_SOURCES[3]]] ^ round_words[round_number])
+            state = words.astype('>u4', order='C').view(np.uint8).reshape(-1, 16)
+
+        # The last round has no MixColumns
+        output[start:start + BLOCK_CHUNK] = SBOX[state[:, SHIFT_ROWS]] ^ round_keys[10]
+    return output
+
+
+# Function that views bytes-like data as an (n, 16) block array
+def to_blocks(data):
+    data = np.frombuffer(bytes(data), dtype=np.uint8)
+    if len(data) % 16:
+        raise ValueError(f"ECB input must be a multiple of 16 bytes, got {len(data)}")
+    return data.reshape(-1, 16)
+
+
+# Function that encrypts data in ECB mode (length must be a multiple of 16 bytes, no padding is added)
+def encrypt_ecb(key, plaintext):
+    return encrypt_blocks(to_blocks(plaintext), expand_key(key)).tobytes()
+
+
+# Function that builds count consecutive 128-bit big-endian counter blocks starting at initial_counter
+def counter_blocks(initial_counter, start, count):
+    value = (int.from_bytes(bytes(initial_counter), 'big') + start) % 2 ** 128  # The counter wraps around
+    high = np.full(count, value >> 64, dtype=np.uint64)
+    low = np.uint64(value & (2 ** 64 - 1)) + np.arange(count, dtype=np.uint64)
+    high += low < np.uint64(value & (2 ** 64 - 1))  # Carry when the low half wraps around
+    counters = np.stack([high, low], axis=1).astype('>u8')
+    return counters.view(np.uint8).reshape(count, 16)
+
+
+# Function that encrypts or decrypts data of any length in CTR mode
+def crypt_ctr(key, initial_counter, data):
+    if len(bytes(initial_counter)) != 16:
+        raise ValueError("CTR mode needs a 16-byte initial counter block")
+    round_keys = expand_key(key)
+    data = np.frombuffer(bytes(data), dtype=np.uint8)
+    output = np.empty_like(data)
+
+    for start in range(0, len(data), BLOCK_CHUNK * 16):
+        piece = data[start:start + BLOCK_CHUNK * 16]
+        count = -(-len(piece) // 16)
+        keystream = encrypt_blocks(counter_blocks(initial_counter, start // 16, count), round_keys)
+        output[start:start + len(piece)] = piece ^ keystream.ravel()[:len(piece)]
+    return output.tobytes()
+
+
+# Function that encrypts one block byte by byte, with MixColumns done through multiply_GF calls
+def encrypt_block_naive(block, round_keys):
+    state = [b ^ k for b, k in zip(block, round_keys[0].tolist())]
+    for round_number in range(1, 11):
+        state = [SBOX_LIST[b] for b in state]
+        state = [state[i] for i in SHIFT_ROWS]
+        if round_number < 10:
+            mixed = []
+            for c in range(4):
+                s0, s1, s2, s3 = state[4 * c:4 * c + 4]
+                mixed += [multiply_GF(s0, 2) ^ multiply_GF(s1, 3) ^ s2 ^ s3,
+                          s0 ^ multiply_GF(s1, 2) ^ multiply_GF(s2, 3) ^ s3,
+                          s0 ^ s1 ^ multiply_GF(s2, 2) ^ multiply_GF(s3, 3),
+                          multiply_GF(s0, 3) ^ s1 ^ s2 ^ multiply_GF(s3, 2)]
+            state = mixed
+        state = [b ^ k for b, k in zip(state, round_keys[round_number].tolist())]
+    return bytes(state)
+
+
+# Function that checks the engine against the FIPS-197 and SP 800-38A test vectors
+def self_test():
+    # FIPS-197 Appendix B and Appendix C.1
+    vectors = [("2b7e151628aed2a6abf7158809cf4f3c", "3243f6a8885a308d313198a2e0370734", "3925841d02dc09fbdc118597196a0b32"),
+               ("000102030405060708090a0b0c0d0e0f", "00112233445566778899aabbccddeeff", "69c4e0d86a7b0430d8cdb78070b4c55a")]
+    for key, plaintext, ciphertext in vectors:
+        key, plaintext, ciphertext = bytes.fromhex(key), bytes.fromhex(plaintext), bytes.fromhex(ciphertext)
+        assert encrypt_ecb(key, plaintext) == ciphertext
+        assert encrypt_block_naive(plaintext, expand_key(key)) == ciphertext
+
+    # SP 800-38A F.1.1 (ECB) and F.5.1 (CTR) with AES-128
+    key = bytes.fromhex("2b7e151628aed2a6abf7158809cf4f3c")
+    plaintext = bytes.fromhex("6bc1bee22e409f96e93d7e117393172a" "ae2d8a571e03ac9c9eb76fac45af8e51"
+                              "30c81c46a35ce411e5fbc1191a0a52ef" "f69f2445df4f9b17ad2b417be66c3710")
+    assert encrypt_ecb(key, plaintext) == bytes.fromhex(
+        "3ad77bb40d7a3660a89ecaf32466ef97" "f5d3d58503b9699de785895a96fdbaaf"
+        "43b1cd7f598ece23881b00e3ed030688" "7b0c785e27e8ad3f8223207104725dd4")
+    counter = bytes.fromhex("f0f1f2f3f4f5f6f7f8f9fafbfcfdfeff")
+    ciphertext = bytes.fromhex("874d6191b620e3261bef6864990db6ce" "9806f66b7970fdff8617187bb9fffdff"
+                               "5ae4df3edbd5d35e5b4f09020db03eab" "1e031dda2fbe03d1792170a0f3009cee")
+    assert crypt_ctr(key, counter, plaintext) == ciphertext
+    assert crypt_ctr(key, counter, ciphertext) == plaintext
+
+
+# Function that compares the T-table engine with the per-byte multiply_GF version
+def benchmark(naive_blocks=2000, table_blocks=1 << 18):
+    round_keys = expand_key(bytes(range(16)))
+    rng = np.random.default_rng(0)
+
+    blocks = rng.integers(0, 256, (naive_blocks, 16), dtype=np.uint8)
+    start = time.perf_counter()
+    for block in blocks.tolist():
+        encrypt_block_naive(block, round_keys)
+    naive_rate = naive_blocks * 16 / (time.perf_counter() - start)
+
+    blocks = rng.integers(0, 256, (table_blocks, 16), dtype=np.uint8)
+    start = time.perf_counter()
+    encrypt_blocks(blocks, round_keys)
+    table_rate = table_blocks * 16 / (time.perf_counter() - start)
+
+    print(f"Per-byte multiply_GF MixColumns: {naive_rate / 1e6:8.3f} MB/s")
+    print(f"Vectorized T-tables:             {table_rate / 1e6:8.3f} MB/s ({table_rate / naive_rate:,.0f}x)")
+
+
+if __name__ == "__main__":
+    self_test()
+    print("FIPS-197 and SP 800-38A test vectors passed.")
+    benchmark()
@@ -0,0 +1,197 @@
+import string
+
+from . import instrument
+
+
+# Translation table for str.translate that shifts letters by a fixed amount
+class ShiftTable(dict):
+    def __init__(self, shift):
+        super().__init__()
+        self.shift = shift % 26
+
+        # Precompute the ASCII letters, which cover almost every input
+        for i in range(26):
+            self[ord('a') + i] = ord('a') + (i + self.shift) % 26
+            self[ord('A') + i] = ord('A') + (i + self.shift) % 26
+
+    # Fill in any other character the first time it is seen, using the same rule as caesar_cipher
+    def __missing__(self, codepoint):
+        char = chr(codepoint)
+        if char.isalpha():
+            base = ord('A') if char.isupper() else ord('a')
+            value = (codepoint - base + self.shift) % 26 + base
+        else:
+            value = codepoint
+        self[codepoint] = value
+        return value
+
+
+# Function that builds the 256-byte table used by bytes.translate for a given shift
+def make_byte_table(shift):
+    shift = shift % 26
+    lower = string.ascii_lowercase
+    upper = string.ascii_uppercase
+    shifted = lower[shift:] + lower[:shift] + upper[shift:] + upper[:shift]
+    return bytes.maketrans((lower + upper).encode('ascii'), shifted.encode('ascii'))
+
+
+# Cache of all 26 shift tables, built once at import
+STR_TABLES = [ShiftTable(shift) for shift in range(26)]
+BYTE_TABLES = [make_byte_table(shift) for shift in range(26)]
+
+
+# Function that turns a key and mode into a shift between 0 and 25
+def normalize_shift(key, mode="encrypt"):
+    if mode == "decrypt":
+        key = -key
+    return key % 26
+
+
+# Function that encrypts/decrypts a given text using the cached Caesar tables
+def caesar_cipher(text, key, mode="encrypt"):
+    """
+    Parameters:
+    - text (str): The input text to encrypt or decrypt.
+    - key (int): The shift key for the Caesar cipher.
+    - mode (str): Either "encrypt" or "decrypt". Defaults to "encrypt".
+
+    Returns:
+    - str: The encrypted or decrypted text, identical to the per-character version.
+    """
+    return text.translate(STR_TABLES[normalize_shift(key, mode)])
+
+
+# Function that encrypts/decrypts a raw byte buffer (only ASCII letters are shifted)
+def caesar_cipher_bytes(data, key, mode="encrypt"):
+    """
+    Parameters:
+    - data (bytes, bytearray or memoryview): The input buffer to encrypt or decrypt.
+    - key (int): The shift key for the Caesar cipher.
+    - mode (str): Either "encrypt" or "decrypt". Defaults to "encrypt".
+
+    Returns:
+    - bytes: The encrypted or decrypted buffer.
+    """
+    return bytes(data).translate(BYTE_TABLES[normalize_shift(key, mode)])
+
+
+# Function that shifts a buffer of letter numbers (0-25) from letter_codec with one table lookup
+def caesar_numbers(numbers, key, mode="encrypt"):
+    import numpy as np
+
+    shift = normalize_shift(key, mode)
+    table = ((np.arange(26) + shift) % 26).astype(np.uint8)
+    return table[np.asarray(numbers)]
+
+
+# Relative frequencies of the letters A-Z in English text.
+# NumPy is only imported by the analysis functions, so plain encryption starts quickly.
+ENGLISH_FREQUENCIES = (
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015, 0.06094, 0.06966,
+    0.00153, 0.00772, 0.04025, 0.02406, 0.06749, 0.07507, 0.01929, 0.00095, 0.05987,
+    0.06327, 0.09056, 0.02758, 0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+)
+
+# Number of bytes read per chunk when building a histogram from a file
+HISTOGRAM_CHUNK_SIZE = 1 << 24
+
+
+# Function that counts the letters A-Z (case-insensitive) in a text or byte buffer
+def letter_histogram(data):
+    import numpy as np
+
+    from .letter_codec import letter_indices
+
+    return np.bincount(letter_indices(data), minlength=26)
+
+
+# Function that streams a file in chunks and counts its letters, optionally stopping after max_bytes
+def file_letter_histogram(filename, max_bytes=None, chunk_size=HISTOGRAM_CHUNK_SIZE):
+    import numpy as np
+
+    histogram = np.zeros(26, dtype=np.int64)
+    remaining = max_bytes
+    with open(filename, 'rb') as f:
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            with instrument.stage("caesar.read"):
+                chunk = f.read(size)
+            if not chunk:
+                break
+            instrument.count("caesar.analyzed_bytes", len(chunk))
+            with instrument.stage("caesar.histogram"):
+                histogram += letter_histogram(chunk)
+            if remaining is not None:
+                remaining -= len(chunk)
+    return histogram
+
+
+# Function that scores all 26 shifts of a letter histogram against English (chi-squared, lower is better)
+def score_shifts(histogram):
+    import numpy as np
+
+    histogram = np.asarray(histogram, dtype=np.float64)
+    total = histogram.sum()
+    if total == 0:
+        raise ValueError("Ciphertext contains no letters to analyze.")
+
+    expected = total * np.array(ENGLISH_FREQUENCIES)
+
+    # shift_index[s, i] is the ciphertext letter that plaintext letter i becomes under shift s
+    shift_index = (np.arange(26)[None, :] + np.arange(26)[:, None]) % 26
+    observed = histogram[shift_index]  # Row s holds the plaintext counts if the key were s
+    return ((observed - expected) ** 2 / expected).sum(axis=1)
+
+
+# Function that ranks the shifts of a histogram from most to least likely
+def rank_shifts(histogram):
+    import numpy as np
+
+    with instrument.stage("caesar.score"):
+        scores = score_shifts(histogram)
+    order = np.argsort(scores, kind='stable')
+    return [(int(shift), float(scores[shift])) for shift in order]
+
+
+# Function that recovers the Caesar shift of a ciphertext without knowing the key
+def crack_caesar(ciphertext, top=5):
+    """
+    Parameters:
+    - ciphertext (str or bytes): The text to analyze.
+    - top (int): How many of the best candidates to decrypt. Defaults to 5.
+
+    Returns:
+    - list: (shift, score, plaintext) tuples, best candidate first.
+    """
+    instrument.count("caesar.analyzed_bytes", len(ciphertext))
+    with instrument.stage("caesar.histogram"):
+        histogram = letter_histogram(ciphertext)
+    ranked = rank_shifts(histogram)[:top]
+    decrypt = caesar_cipher if isinstance(ciphertext, str) else caesar_cipher_bytes
+    return [(shift, score, decrypt(ciphertext, shift, mode="decrypt")) for shift, score in ranked]
+
+
+# Function that recovers the Caesar shift of a large file from its (optionally sampled) letter counts
+def crack_caesar_file(filename, max_bytes=None):
+    return rank_shifts(file_letter_histogram(filename, max_bytes=max_bytes))
+
+
+# Example usage
+if __name__ == "__main__":
+    plaintext = "Hello, World!"
+    key_value = 3
+
+    ciphertext = caesar_cipher(plaintext, key_value, mode="encrypt")
+    print(f"Encrypted: {ciphertext}")
+
+    decrypted_text = caesar_cipher(ciphertext, key_value, mode="decrypt")
+    print(f"Decrypted: {decrypted_text}")
+
+    import os
+
+    from .homework import HOMEWORK_1
+
+    with open(os.path.join(HOMEWORK_1, "class_input_c.txt"), "r", encoding="utf-8") as f:
+        intercepted = f.readlines()[1].strip()
+    shift, score, recovered = crack_caesar(intercepted, top=1)[0]
+    print(f"Recovered shift {shift} (score {score:.1f}): {recovered}")
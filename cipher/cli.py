@@ -0,0 +1,118 @@
+import argparse
+import sys
+
+from . import instrument
+
+# Only the standard library is imported here; each command imports the cipher code it needs,
+# so a small Caesar job does not pay for loading NumPy.
+
+
+# Function that turns a Caesar --key value into a shift: a number, or letters using the key rule
+def caesar_shift(key, key_rule):
+    from .stream_cipher import caesar_shift_from_key
+
+    if key.lstrip("-").isdigit():
+        return int(key)
+    return caesar_shift_from_key(key, key_rule)
+
+
+# Function that opens the input: --text if given, otherwise a file ("-" for stdin)
+def open_input(args):
+    import io
+
+    from .stream_cipher import open_stream
+
+    if args.text is not None:
+        return io.StringIO(args.text)
+    return open_stream(args.input, "r")
+
+
+# Function that encrypts or decrypts the input; without --key the first input line is the key
+def run_transform(args, infile, outfile):
+    from .stream_cipher import stream_caesar, stream_caesar_text, stream_hill, stream_hill_text
+
+    if args.cipher == "caesar":
+        if args.key is None:
+            stream_caesar(infile, outfile, args.command, args.key_rule, args.chunk_size)
+        else:
+            stream_caesar_text(infile, outfile, caesar_shift(args.key, args.key_rule), args.command, args.chunk_size)
+    elif args.key is None:
+        stream_hill(infile, outfile, args.command, args.chunk_size)
+    else:
+        stream_hill_text(infile, outfile, args.key, args.command, args.chunk_size)
+
+
+# Function that recovers the key of a ciphertext and prints the best candidates
+def run_crack(args, infile, outfile):
+    ciphertext = infile.read()
+    if args.cipher == "caesar":
+        from .caesar import crack_caesar
+
+        candidates = crack_caesar(ciphertext, top=max(args.top, 1))
+        for shift, score, plaintext in candidates:
+            print(f"shift {shift:2d}  score {score:12.1f}  {plaintext[:60]!r}", file=sys.stderr)
+        outfile.write(candidates[0][2])
+    else:
+        from .hill_attack import brute_force_hill
+
+        progress = (lambda message: print(message, file=sys.stderr)) if args.verbose else None
+        candidates = brute_force_hill(ciphertext, args.block_size, results=args.top, progress=progress)
+        if not candidates:
+            raise ValueError("no key found")
+        for fitness, key_matrix, plaintext in candidates:
+            print(f"key {key_matrix.tolist()}  fitness {fitness:10.1f}  {plaintext[:60]!r}", file=sys.stderr)
+        outfile.write(candidates[0][2])
+
+
+# Function that builds the argument parser for the cipher command
+def build_parser():
+    from .stream_cipher import CHUNK_SIZE, positive_int
+
+    parser = argparse.ArgumentParser(prog="cipher", description="Encrypt, decrypt or crack Caesar and Hill ciphers.")
+    instrument.add_arguments(parser)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for command in ("encrypt", "decrypt", "crack"):
+        sub = commands.add_parser(command, help=f"{command} a message")
+        sub.add_argument("cipher", choices=["caesar", "hill"])
+        sub.add_argument("input", nargs="?", default="-", help="input file ('-' or omitted for stdin)")
+        sub.add_argument("-o", "--output", default="-", help="output file (default: stdout)")
+        sub.add_argument("--text", help="use this text as the input instead of a file")
+        if command == "crack":
+            sub.add_argument("--top", type=int, default=5, help="number of candidates to list on stderr")
+            sub.add_argument("--block-size", type=int, default=2, help="Hill key size to search (2 or 3)")
+            sub.add_argument("-v", "--verbose", action="store_true", help="report search progress")
+        else:
+            sub.add_argument("--key", help="Caesar shift or key letters, or Hill key string "
+                                           "(default: read from the first input line)")
+            sub.add_argument("--key-rule", choices=["first", "sum"], default="first",
+                             help="how Caesar key letters become a shift (default: first letter)")
+            sub.add_argument("--chunk-size", type=positive_int, default=CHUNK_SIZE, help="characters read per chunk")
+    return parser
+
+
+# Function that parses command-line arguments and runs the requested command
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    from .stream_cipher import open_stream
+
+    infile = outfile = None
+    try:
+        infile = open_input(args)
+        outfile = open_stream(args.output, "w")
+        run = run_crack if args.command == "crack" else run_transform
+        instrument.run_with_options(args, run, args, infile, outfile)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if infile is not None and infile is not sys.stdin:
+            infile.close()
+        if outfile is not None and outfile is not sys.stdout:
+            outfile.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
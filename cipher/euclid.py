@@ -0,0 +1,451 @@
+# Extended Euclidean Algorithm program
+# Irving Reyes Bravo
+# 02/25/2025
+
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import time
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from math import gcd
+
+from . import instrument
+from .homework import HOMEWORK_2
+
+
+# One row of the Extended Euclidean Algorithm table (namedtuples carry no per-row __dict__)
+StepRow = namedtuple("StepRow", ["i", "r", "q", "x", "y"])
+
+
+# Yields the table rows of the Extended Euclidean Algorithm one step at a time.
+def euclidean_steps(a, b):
+    r_prev, r = a, b
+    x_prev, x = 1, 0
+    y_prev, y = 0, 1
+
+    i = -1
+    while r != 0:
+        i += 1
+        q = r_prev // r
+        r_prev, r = r, r_prev - q * r
+        x_prev, x = x, x_prev - q * x
+        y_prev, y = y, y_prev - q * y
+        yield StepRow(i, r_prev, q, x_prev, y_prev)
+
+
+# Computes the GCD of a and b using the Extended Euclidean Algorithm.
+# With trace=False the steps are not stored, so memory stays constant.
+# With fast=True no step table is kept, and non-negative operands of LEHMER_MIN_BITS or more
+# use Lehmer's algorithm (which only handles non-negative operands).
+def extended_euclidean(a, b, fast=False, trace=True):
+    instrument.count("euclid.calls")
+    if fast and a >= 0 and b >= 0 and max(a.bit_length(), b.bit_length()) >= LEHMER_MIN_BITS:
+        gcd, x, _ = lehmer_extended_gcd(a, b)
+        return (x % b if gcd == 1 else None), None
+
+    if trace and not fast:
+        table = list(euclidean_steps(a, b))
+        instrument.count("euclid.steps", len(table))
+        gcd, x_prev = (table[-1].r, table[-1].x) if table else (a, 1)
+    else:
+        table = None
+        r_prev, r = a, b
+        x_prev, x = 1, 0
+        while r != 0:
+            q = r_prev // r
+            r_prev, r = r, r_prev - q * r
+            x_prev, x = x, x_prev - q * x
+        gcd = r_prev
+
+    # If GCD is not 1, no multiplicative inverse exists
+    if gcd != 1:
+        return None, table
+
+    # Return x_prev as the modular inverse (mod b)
+    return x_prev % b, table
+
+
+# Number of low bits dropped from each operand so Lehmer's inner loop runs on single words
+WORD_BITS = 64
+
+# Operand size from which fast mode switches to Lehmer's algorithm. Below it the plain loop is faster
+# (about 2.5x at 256 bits and 2x at 1024 bits, and still slightly ahead at 2048 and 2560 bits);
+# Lehmer wins from about 3072 bits (1.2x) and is about 1.9x faster at 8192 bits.
+LEHMER_MIN_BITS = 3072
+
+
+# Computes (gcd, x, y) with a*x + b*y = gcd using Lehmer's algorithm (Knuth, Algorithm L).
+# The quotients are found from the leading 64 bits of the operands and collected in a
+# 2x2 cofactor matrix, so many steps cost only four big-integer multiplications.
+def lehmer_extended_gcd(a, b):
+    if b == 0:
+        return a, 1, 0
+
+    # r0 = x0*a + (...)*b and r1 = x1*a + (...)*b; y is recovered at the end
+    r0, r1 = a, b
+    x0, x1 = 1, 0
+    if r0 < r1:
+        r0, r1, x0, x1 = r1, r0, x1, x0
+
+    while r1 >> WORD_BITS:
+        shift = r0.bit_length() - WORD_BITS
+        u, v = r0 >> shift, r1 >> shift
+        A, B, C, D = 1, 0, 0, 1
+
+        # Simulate Euclid on the leading words while both bounds agree on the quotient
+        while v + C != 0 and v + D != 0:
+            q = (u + A) // (v + C)
+            if q != (u + B) // (v + D):
+                break
+            A, C = C, A - q * C
+            B, D = D, B - q * D
+            u, v = v, u - q * v
+
+        if B == 0:
+            # No quotient could be decided from the leading words: take one full-precision step
+            q = r0 // r1
+            r0, r1 = r1, r0 - q * r1
+            x0, x1 = x1, x0 - q * x1
+        else:
+            r0, r1 = A * r0 + B * r1, C * r0 + D * r1
+            x0, x1 = A * x0 + B * x1, C * x0 + D * x1
+
+    # Finish with ordinary Euclid once the remainders fit in a word
+    while r1:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        x0, x1 = x1, x0 - q * x1
+
+    return r0, x0, (r0 - a * x0) // b
+
+
+# Computes the inverses of many values modulo the same modulus with Montgomery's trick.
+# Only one extended_euclidean call is made per batch; values that share a factor with
+# the modulus (including 0) get None instead of failing the whole batch.
+def batch_mod_inverse(values, modulus):
+    if hasattr(values, "dtype"):
+        return batch_mod_inverse_array(values, modulus)
+
+    instrument.count("euclid.batch_inversions", len(values))
+    values = [v % modulus for v in values]
+    usable = [i for i, v in enumerate(values) if gcd(v, modulus) == 1]
+    inverses = [None] * len(values)
+    if not usable:
+        return inverses
+
+    # prefix[k] is the product of the first k usable values
+    prefix = [1]
+    for i in usable:
+        prefix.append(prefix[-1] * values[i] % modulus)
+
+    # Invert the product of all of them once, then peel off one value at a time
+    running, _ = extended_euclidean(prefix[-1], modulus, fast=True)
+    for k in range(len(usable) - 1, -1, -1):
+        i = usable[k]
+        inverses[i] = running * prefix[k] % modulus
+        running = running * values[i] % modulus
+
+    return inverses
+
+
+# NumPy version of batch_mod_inverse for moduli below 2^32: a product tree replaces the
+# prefix products so every level is one vectorized multiply. Returns (inverses, valid mask).
+def batch_mod_inverse_array(values, modulus):
+    import numpy as np
+
+    if not 1 < modulus < 2 ** 32:
+        raise ValueError("NumPy batch inversion needs 1 < modulus < 2^32")
+
+    m = np.uint64(modulus)
+    values = np.asarray(values, dtype=np.int64) % modulus
+    instrument.count("euclid.batch_inversions", len(values))
+    valid = np.gcd(values, modulus) == 1
+    if len(values) == 0:
+        return values, valid
+    leaves = np.where(valid, values, 1).astype(np.uint64)
+
+    # Build the product tree bottom-up; odd levels are padded with a 1
+    levels = [leaves]
+    while len(levels[-1]) > 1:
+        level = levels[-1]
+        if len(level) % 2:
+            level = np.append(level, np.uint64(1))
+        levels.append(level[0::2] * level[1::2] % m)
+
+    # Invert the root once, then push inverses back down the tree
+    root_inverse, _ = extended_euclidean(int(levels[-1][0]), modulus, fast=True)
+    inverse = np.array([root_inverse], dtype=np.uint64)
+    for level in reversed(levels[:-1]):
+        size = len(level)
+        if size % 2:
+            level = np.append(level, np.uint64(1))
+        children = np.empty(len(level), dtype=np.uint64)
+        children[0::2] = inverse * level[1::2] % m
+        children[1::2] = inverse * level[0::2] % m
+        inverse = children[:size]
+
+    return np.where(valid, inverse, 0).astype(np.int64), valid
+
+
+# Runs the same recurrence as extended_euclidean elementwise over int64 arrays (values below 2^63).
+# Lanes that have finished are dropped after every step, and the loop ends when every lane has.
+# Returns (gcd, x, y, inverse, valid) arrays with a*x + b*y = gcd; inverse is only meaningful where valid.
+def extended_euclidean_array(a, b):
+    import numpy as np
+
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64))
+    if (a < 0).any() or (b < 0).any():
+        raise ValueError("extended_euclidean_array needs non-negative operands")
+    shape = a.shape
+    a, b = a.ravel(), b.ravel()
+    instrument.count("euclid.array_lanes", len(a))
+
+    gcd_out = a.copy()
+    x_out = np.ones_like(a)
+    y_out = np.zeros_like(a)
+
+    # State of the lanes still running, plus where each one came from
+    lanes = np.flatnonzero(b != 0)
+    r_prev, r = a[lanes], b[lanes]
+    x_prev, x = np.ones_like(r), np.zeros_like(r)
+    y_prev, y = np.zeros_like(r), np.ones_like(r)
+
+    while len(lanes):
+        q = r_prev // r
+        r_prev, r = r, r_prev - q * r
+        x_prev, x = x, x_prev - q * x
+        y_prev, y = y, y_prev - q * y
+
+        # Record the lanes whose remainder just reached 0 and keep only the others
+        done = r == 0
+        if done.any():
+            finished = lanes[done]
+            gcd_out[finished] = r_prev[done]
+            x_out[finished] = x_prev[done]
+            y_out[finished] = y_prev[done]
+
+            running = ~done
+            lanes = lanes[running]
+            r_prev, r = r_prev[running], r[running]
+            x_prev, x = x_prev[running], x[running]
+            y_prev, y = y_prev[running], y[running]
+
+    valid = (gcd_out == 1) & (b != 0)
+    inverse = np.where(valid, x_out % np.where(b != 0, b, 1), 0)
+    return tuple(array.reshape(shape) for array in (gcd_out, x_out, y_out, inverse, valid))
+
+
+# Writes the Extended Euclidean Algorithm steps to a file.
+# table can be any iterable of rows (such as euclidean_steps), and is consumed as it is written.
+def write_table_to_file(a, b, inverse, table, filename="output.txt"):
+    with instrument.stage("euclid.write_table"), open(filename, "w", buffering=1 << 16) as f:
+        f.write(f"Extended Euclidean Algorithm for a = {a}, b = {b}\n")
+        f.write(f"Multiplicative Inverse: {inverse}\n" if inverse else "No Inverse Exists\n")
+        f.write("\nTable:\n")
+        f.write("i   |   r_i   |   q_i   |   x_i   |   y_i   \n")
+        f.write("-" * 40 + "\n")
+        f.writelines(f"{row[0]:<3} | {row[1]:<7} | {row[2]:<6} | {row[3]:<7} | {row[4]:<7}\n" for row in table)
+
+
+# Writes the steps for (a, b) to a file without ever holding the whole table in memory.
+# The inverse is found first with tracing off, then the steps are regenerated straight into the file.
+def write_trace_to_file(a, b, filename="output.txt"):
+    inverse, _ = extended_euclidean(a, b, trace=False)
+    write_table_to_file(a, b, inverse, euclidean_steps(a, b), filename)
+    return inverse
+
+
+# Times pow(a, -1, m), the table-building extended_euclidean and the fast mode on random operands.
+def benchmark_fast_mode(bit_lengths=(512, 1024, 2048, 4096, 8192), trials=20):
+    print(f"{'bits':>5} | {'pow(a, -1, m)':>14} | {'table mode':>12} | {'fast mode':>12}")
+    print("-" * 54)
+    for bits in bit_lengths:
+        pairs = []
+        while len(pairs) < trials:
+            a, m = random.getrandbits(bits), random.getrandbits(bits) | 1 << (bits - 1)
+            if gcd(a, m) == 1:
+                pairs.append((a, m))
+
+        timings = []
+        for method in (lambda a, m: pow(a, -1, m),
+                       lambda a, m: extended_euclidean(a, m)[0],
+                       lambda a, m: extended_euclidean(a, m, fast=True)[0]):
+            start = time.perf_counter()
+            for a, m in pairs:
+                method(a, m)
+            timings.append((time.perf_counter() - start) / trials * 1e6)
+
+        print(f"{bits:>5} | {timings[0]:>11.1f} us | {timings[1]:>9.1f} us | {timings[2]:>9.1f} us")
+
+
+# Function that checks the modulus of an (a, b) pair, so a bad row fails while reading, not in a worker
+def checked_pair(a, b, where):
+    if b <= 0:
+        raise ValueError(f"{where}: modulus b must be positive, got {b}")
+    return a, b
+
+
+# Function that turns one JSON record, {"a": ..., "b": ...} or [a, b], into an (a, b) pair of ints
+def json_pair(record, where):
+    pair = [record.get("a"), record.get("b")] if isinstance(record, dict) else record
+    if not isinstance(pair, list) or len(pair) != 2 or \
+            not all(isinstance(v, int) and not isinstance(v, bool) for v in pair):
+        raise ValueError(f"{where}: expected {{\"a\": int, \"b\": int}} or [a, b], got {record!r}")
+    return checked_pair(pair[0], pair[1], where)
+
+
+# Reads (a, b) pairs lazily from a CSV file ("a,b" per row, optional header row), a JSONL file
+# (one {"a": ..., "b": ...} object or [a, b] list per line) or a JSON file holding one list of them.
+# A .json file is parsed whole, so it is only meant for small inputs; CSV and JSONL are streamed.
+# A row that is not a pair of integers with b > 0 raises ValueError naming its line.
+def read_pairs(path):
+    with open(path, "r", newline="") as f:
+        if path.endswith(".jsonl"):
+            for line_number, line in enumerate(f, 1):
+                if line.strip():
+                    where = f"{path}:{line_number}"
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(f"{where}: {e.msg}") from None
+                    yield json_pair(record, where)
+        elif path.endswith(".json"):
+            records = json.load(f)
+            if not isinstance(records, list):
+                raise ValueError(f"{path}: expected a JSON list of pairs")
+            for index, record in enumerate(records):
+                yield json_pair(record, f"{path}[{index}]")
+        else:
+            reader = csv.reader(f)
+            for row in reader:
+                if not row:
+                    continue
+                try:
+                    if len(row) != 2:
+                        raise ValueError(f"expected 2 fields, got {len(row)}")
+                    pair = int(row[0]), int(row[1])
+                except ValueError as e:
+                    # Only the first line may be a header such as "a,b"
+                    if reader.line_num == 1 and not row[0].strip().lstrip("-").isdigit():
+                        continue
+                    raise ValueError(f"{path}:{reader.line_num}: {e}") from None
+                yield checked_pair(*pair, f"{path}:{reader.line_num}")
+
+
+# Groups an iterable into lists of at most size items.
+def chunked(iterable, size):
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+# Solves one chunk of pairs and returns the formatted output lines as a single string,
+# so only one string per chunk travels back from the worker process.
+def solve_chunk(pairs, as_json=False, with_trace=False):
+    lines = []
+    for a, b in pairs:
+        if with_trace:
+            inverse, table = extended_euclidean(a, b)
+        else:
+            inverse, table = extended_euclidean(a, b, trace=False)
+
+        if as_json:
+            record = {"a": a, "b": b, "inverse": inverse}
+            if with_trace:
+                record["trace"] = [list(row) for row in table]
+            lines.append(json.dumps(record) + "\n")
+        else:
+            lines.append(f"{a},{b},{'' if inverse is None else inverse}\n")
+    return "".join(lines)
+
+
+# Solves every pair in input_path on a process pool and writes the results, in input order,
+# to output_path (JSONL if it ends in .jsonl, otherwise CSV). Returns (pairs, seconds).
+# If the input is missing or has a bad row, the partly written output file is removed.
+def run_batch(input_path, output_path, workers=None, chunk_size=10000, with_trace=False):
+    workers = workers or os.cpu_count() or 1
+    start = time.perf_counter()
+    try:
+        count = write_batch(input_path, output_path, workers, chunk_size, with_trace)
+    except (OSError, ValueError):
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        raise
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {count} pairs in {elapsed:.2f}s ({count / max(elapsed, 1e-9):,.0f} pairs/s, {workers} workers)")
+    return count, elapsed
+
+
+# Function that does the work of run_batch and returns the number of pairs written
+def write_batch(input_path, output_path, workers, chunk_size, with_trace):
+    as_json = output_path.endswith(".jsonl")
+    count = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool, open(output_path, "w", buffering=1 << 20) as out:
+        if not as_json:
+            out.write("a,b,inverse\n")
+
+        # Waits for the oldest chunk still in flight and writes its lines
+        def write_oldest():
+            size, future = pending.popleft()
+            with instrument.stage("euclid.batch.wait"):
+                lines = future.result()
+            with instrument.stage("euclid.batch.write"):
+                out.write(lines)
+            instrument.count("euclid.batch.pairs", size)
+            return size
+
+        # Keep a bounded number of chunks in flight and write them back in submission order
+        pending = deque()
+        for chunk in chunked(read_pairs(input_path), chunk_size):
+            pending.append((len(chunk), pool.submit(solve_chunk, chunk, as_json, with_trace)))
+            if len(pending) >= workers * 4:
+                count += write_oldest()
+        while pending:
+            count += write_oldest()
+    return count
+
+
+# Function that parses command-line arguments and runs the benchmark, a batch or the test cases
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Extended Euclidean Algorithm")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("benchmark", help="compare pow(), table mode and fast mode on big operands")
+    batch = commands.add_parser("batch", help="solve (a, b) pairs from a CSV or JSONL file")
+    batch.add_argument("input", help="CSV (a,b per row), JSONL or (small inputs only) JSON input file")
+    batch.add_argument("output", help="output file (.jsonl for JSON lines, otherwise CSV)")
+    batch.add_argument("--workers", type=int, default=None, help="worker processes (default: all cores)")
+    batch.add_argument("--chunk-size", type=int, default=10000, help="pairs per task sent to a worker")
+    batch.add_argument("--trace", action="store_true", help="include the step table in JSONL output")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    try:
+        instrument.run_with_options(args, run_command, args)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+# Function that runs the command chosen on the command line (the test cases when there is none)
+def run_command(args):
+    if args.command == "benchmark":
+        benchmark_fast_mode()
+    elif args.command == "batch":
+        run_batch(args.input, args.output, args.workers, args.chunk_size, args.trace)
+    else:
+        # Test cases
+        problems = [(550, 1769), (950, 1767), (8144, 39901)]
+        for a, b in problems:
+            write_trace_to_file(a, b, os.path.join(HOMEWORK_2, f"output_{a}_{b}.txt"))
+            print(f"Processed (a={a}, b={b}). Output saved to output_{a}_{b}.txt")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+import threading
+
+# Largest n for which log/exp tables are built (2 * 2^16 entries); larger fields use comb multiplication
+MAX_TABLE_BITS = 16
+
+# Width in bits of the windows used by comb multiplication and by the reduction tables
+COMB_BITS = 4
+REDUCE_BITS = 8
+
+
+# Function that multiplies two polynomials over GF(2) without reduction (carry-less multiplication)
+def clmul(a, b):
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        b >>= 1
+    return result
+
+
+# Function that reduces a polynomial modulo poly with plain long division
+def poly_mod(a, poly):
+    degree = poly.bit_length() - 1
+    while a.bit_length() - 1 >= degree:
+        a ^= poly << (a.bit_length() - 1 - degree)
+    return a
+
+
+# Function that finds the greatest common divisor of two polynomials over GF(2)
+def poly_gcd(a, b):
+    while b:
+        a, b = b, poly_mod(a, b)
+    return a
+
+
+# Function that lists the distinct prime factors of a positive integer
+def prime_factors(value):
+    factors = []
+    p = 2
+    while p * p <= value:
+        if value % p == 0:
+            factors.append(p)
+            while value % p == 0:
+                value //= p
+        p += 1
+    if value > 1:
+        factors.append(value)
+    return factors
+
+
+# Function that checks whether poly (of degree n) is irreducible over GF(2) with Rabin's test
+def is_irreducible(poly, n):
+    if poly >> n != 1:
+        return False
+
+    x = poly_mod(0b10, poly)
+
+    # x^(2^k) mod poly, computed by repeated squaring
+    def x_power_of_two(k):
+        value = x
+        for _ in range(k):
+            value = poly_mod(clmul(value, value), poly)
+        return value
+
+    if x_power_of_two(n) != x:
+        return False
+    return all(poly_gcd(poly, x_power_of_two(n // p) ^ x) == 1 for p in prime_factors(n))
+
+
+# Arithmetic in GF(2^n) modulo an irreducible polynomial; one shared instance per (n, poly)
+class GaloisField:
+    _instances = {}
+    _lock = threading.Lock()
+
+    def __new__(cls, n, poly):
+        key = (n, poly)
+        with cls._lock:
+            field = cls._instances.get(key)
+            if field is None:
+                field = super().__new__(cls)
+                field._build(n, poly)
+                cls._instances[key] = field
+        return field
+
+    # Validates the polynomial and precomputes the tables for this field
+    def _build(self, n, poly):
+        if not 1 <= n <= 64:
+            raise ValueError(f"GF(2^{n}) is not supported; n must be between 1 and 64")
+        if not is_irreducible(poly, n):
+            raise ValueError(f"Polynomial {poly:#x} is not irreducible of degree {n}")
+
+        self.n = n
+        self.poly = poly
+        self.size = 1 << n
+        self.order = self.size - 1  # Size of the multiplicative group
+
+        # reduce_table[t] is (t * x^n) mod poly, used to clear REDUCE_BITS high bits at a time
+        self.reduce_table = [poly_mod(t << n, poly) for t in range(1 << REDUCE_BITS)]
+
+        self.uses_tables = n <= MAX_TABLE_BITS
+        if self.uses_tables:
+            self._build_log_tables()
+
+    # Builds the exp/log tables from the smallest generator of the multiplicative group
+    def _build_log_tables(self):
+        self.generator = self._find_generator()
+
+        # exp is doubled in length so exp[log[a] + log[b]] never needs a "mod order"
+        self.exp = [0] * (2 * self.order)
+        self.log = [0] * self.size
+        value = 1
+        for power in range(self.order):
+            self.exp[power] = self.exp[power + self.order] = value
+            self.log[value] = power
+            value = self._comb_multiply(value, self.generator)
+
+    # Returns the smallest element whose powers reach every non-zero element
+    def _find_generator(self):
+        if self.order == 1:
+            return 1
+        cofactors = [self.order // p for p in prime_factors(self.order)]
+        for candidate in range(2, self.size):
+            if all(self._comb_power(candidate, e) != 1 for e in cofactors):
+                return candidate
+        raise ValueError(f"No generator found for polynomial {self.poly:#x}")
+
+    # Reduces a product of two field elements (degree < 2n - 1) with the reduction table
+    def _reduce(self, product):
+        n = self.n
+        shift = (n - 2) // REDUCE_BITS * REDUCE_BITS  # Lowest window that can hold bits >= n
+        mask = (1 << REDUCE_BITS) - 1
+        while shift >= 0:
+            high = (product >> (n + shift)) & mask
+            if high:
+                product ^= (high << (n + shift)) ^ (self.reduce_table[high] << shift)
+            shift -= REDUCE_BITS
+        return product
+
+    # Multiplies with a COMB_BITS-wide window over b, then reduces
+    def _comb_multiply(self, a, b):
+        multiples = [0] * (1 << COMB_BITS)
+        for w in range(1, 1 << COMB_BITS):
+            multiples[w] = multiples[w >> 1] << 1 if not w & 1 else multiples[w ^ 1] ^ a
+
+        mask = (1 << COMB_BITS) - 1
+        product = 0
+        for shift in range((b.bit_length() - 1) // COMB_BITS * COMB_BITS, -1, -COMB_BITS):
+            product = (product << COMB_BITS) ^ multiples[(b >> shift) & mask]
+        return self._reduce(product)
+
+    # Raises a to the power e with square-and-multiply
+    def _comb_power(self, a, e):
+        result = 1
+        while e:
+            if e & 1:
+                result = self._comb_multiply(result, a)
+            a = self._comb_multiply(a, a)
+            e >>= 1
+        return result
+
+    # Addition (and subtraction) is XOR in every GF(2^n)
+    def add(self, a, b):
+        return a ^ b
+
+    subtract = add
+
+    def multiply(self, a, b):
+        if not self.uses_tables:
+            return self._comb_multiply(a, b)
+        if a == 0 or b == 0:
+            return 0
+        return self.exp[self.log[a] + self.log[b]]
+
+    def inverse(self, a):
+        if a == 0:
+            raise ValueError(f"Zero has no multiplicative inverse in GF(2^{self.n})")
+        if not self.uses_tables:
+            return self._comb_power(a, self.order - 1)  # a^(2^n - 2) = a^-1
+        return self.exp[self.order - self.log[a]]
+
+    def divide(self, a, b):
+        if b == 0:
+            raise ValueError(f"Division by zero in GF(2^{self.n})")
+        if not self.uses_tables:
+            return self.multiply(a, self.inverse(b))
+        if a == 0:
+            return 0
+        return self.exp[self.log[a] - self.log[b] + self.order]
+
+    def power(self, a, e):
+        if a == 0:
+            if e < 0:
+                raise ValueError(f"Zero has no multiplicative inverse in GF(2^{self.n})")
+            return 1 if e == 0 else 0
+        if not self.uses_tables:
+            return self._comb_power(a, e % self.order)  # a^order = 1, so negative powers become positive
+        return self.exp[self.log[a] * e % self.order]
+
+    def __repr__(self):
+        return f"GaloisField({self.n}, {self.poly:#x})"
+
+
+# The AES field used by gf256.py, x^8 + x^4 + x^3 + x + 1
+AES_FIELD = GaloisField(8, 0x11b)
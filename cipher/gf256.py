@@ -0,0 +1,206 @@
+import os
+
+from . import instrument
+from .homework import HOMEWORK_3
+
+
+# Function that converts 8-bit binary string to integer
+def binary_to_int(binary_str):
+    return int(binary_str, 2)
+
+
+# Function that converts integer to 8-bit binary string
+def int_to_binary(num):
+    return format(num, '08b')
+
+
+# Function that performs addition in GF(2^8) (XOR operation)
+def add_GF(a, b):
+    return a ^ b
+
+
+# Function that performs subtraction in GF(2^8) like addition (XOR operation)
+def subtract_GF(a, b):
+    return a ^ b
+
+
+# Function that performs multiplication in GF(2^8) with reduction by m(x) = x^8 + x^4 + x^3 + x + 1
+# (shift-and-XOR version, used to build the lookup tables below)
+def multiply_GF_bitwise(a, b):
+    # AES irreducible polynomial represented as a number
+    AES_POLYNOMIAL = 0x11b  # x^8 + x^4 + x^3 + x + 1
+
+    p = 0
+    for i in range(8):
+        # If the i-th bit of b is set
+        if b & (1 << i):
+            # Add (XOR) a shifted i times to the product
+            p ^= a << i
+
+    # Modular Reduction:
+    for i in range(15, 7, -1):  # From degree 15 to degree 8
+        # If the i-th bit is set
+        if p & (1 << i):
+            # reduce the polynomial, then shift it to align with the i-th bit
+            p ^= AES_POLYNOMIAL << (i - 8)
+
+    return p
+
+
+# Function that finds the multiplicative inverse of a element in GF(2^8)
+# (polynomial Extended Euclidean version, used to build the lookup tables below)
+def inverse_GF_euclid(a):
+    # Edge case: 0 has no multiplicative inverse
+    if a == 0:
+        raise ValueError("Zero has no multiplicative inverse in GF(2^8)")
+
+    # Extended Euclidean Algorithm:
+    AES_POLYNOMIAL = 0x11b  # x^8 + x^4 + x^3 + x + 1
+    r0, r1 = AES_POLYNOMIAL, a
+    s0, s1 = 0, 1
+    t0, t1 = 1, 0
+
+    while r1 != 0:
+        # Degree of r0 and r1
+        deg_r0 = r0.bit_length() - 1 if r0 > 0 else -1
+        deg_r1 = r1.bit_length() - 1 if r1 > 0 else -1
+
+        if deg_r1 <= 0:
+            break
+
+        # Compute quotient and remainder
+        shift = deg_r0 - deg_r1
+        if shift >= 0:
+            r0 ^= r1 << shift
+            s0 ^= s1 << shift
+            t0 ^= t1 << shift
+
+        # Swap variables
+        r0, r1 = r1, r0
+        s0, s1 = s1, s0
+        t0, t1 = t1, t0
+
+    # Ensures result is in the field (0-255)
+    return s1 & 0xFF
+
+
+# Function that builds the exponent/logarithm tables of GF(2^8) for the generator 0x03
+def build_log_tables():
+    GENERATOR = 0x03
+
+    # EXP is doubled in length so EXP[LOG[a] + LOG[b]] never needs a "mod 255"
+    exp_table = [0] * 510
+    log_table = [0] * 256
+    value = 1
+    for power in range(255):
+        exp_table[power] = exp_table[power + 255] = value
+        log_table[value] = power
+        value = multiply_GF_bitwise(value, GENERATOR)
+
+    inverse_table = [0] * 256  # 0 has no inverse; its entry is never used
+    for a in range(1, 256):
+        inverse_table[a] = inverse_GF_euclid(a)
+
+    return exp_table, log_table, inverse_table
+
+
+# Lookup tables, built once when the module is loaded
+EXP_TABLE, LOG_TABLE, INVERSE_TABLE = build_log_tables()
+
+
+# Function that performs multiplication in GF(2^8) with two table lookups
+def multiply_GF(a, b):
+    if a == 0 or b == 0:
+        return 0
+    return EXP_TABLE[LOG_TABLE[a] + LOG_TABLE[b]]
+
+
+# Function that finds the multiplicative inverse of a element in GF(2^8) with a table lookup
+def inverse_GF(a):
+    # Edge case: 0 has no multiplicative inverse
+    if a == 0:
+        raise ValueError("Zero has no multiplicative inverse in GF(2^8)")
+    return INVERSE_TABLE[a]
+
+
+# Function that performs division in GF(2^8) (log(a) - log(b) in the tables)
+def divide_GF(a, b):
+    if b == 0:
+        raise ValueError("Division by zero in GF(2^8)")
+    if a == 0:
+        return 0
+    return EXP_TABLE[LOG_TABLE[a] - LOG_TABLE[b] + 255]
+
+
+# Function that checks the table versions against the bitwise/Euclid versions for every operand pair
+def verify_tables():
+    for a in range(256):
+        for b in range(256):
+            if multiply_GF(a, b) != multiply_GF_bitwise(a, b):
+                return False
+            if b and divide_GF(a, b) != multiply_GF_bitwise(a, inverse_GF_euclid(b)):
+                return False
+    return all(inverse_GF(a) == inverse_GF_euclid(a) for a in range(1, 256))
+
+
+# Function that processes a single calculation from an input file's line
+def perform_calculation(line):
+    parts = line.strip().split()
+    if len(parts) != 3:
+        raise ValueError(f"Invalid input format: {line}")
+
+    a_bin, b_bin, op = parts
+    a = binary_to_int(a_bin)
+    b = binary_to_int(b_bin)
+
+    if op == '+':
+        result = add_GF(a, b)
+    elif op == '-':
+        result = subtract_GF(a, b)
+    elif op == '*':
+        result = multiply_GF(a, b)
+    elif op == '/':
+        try:
+            result = divide_GF(a, b)
+        except ValueError as e:
+            return f"Error: {e}"
+    else:
+        return f"Error: Unknown operation {op}"
+
+    return int_to_binary(result)
+
+
+# Function that processes all calculations from input file; writes to output file
+def process_files(input_file_path, output_file_path):
+    with instrument.stage("gf.process_files"), open(input_file_path, 'r') as infile, \
+            open(output_file_path, 'w') as outfile:
+        lines = 0
+        for line in infile:
+            if line.strip():  # Skip empty lines
+                result = perform_calculation(line)
+                outfile.write(f"{result}\n")
+                lines += 1
+        instrument.count("gf.lines", lines)
+
+
+# Function that tests the program with both input files
+def process_homework_files():
+    # Test with the provided input file
+    process_files(os.path.join(HOMEWORK_3, "class_input_5C.txt"), os.path.join(HOMEWORK_3, "class_output_5C.txt"))
+
+    # Test with my own calculations , Wh
+    process_files(os.path.join(HOMEWORK_3, "reyes_input_5C.txt"), os.path.join(HOMEWORK_3, "reyes_output_5C.txt"))
+
+
+# Main function that runs the homework files, optionally with --profile / --metrics
+def main(argv=None):
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the GF(2^8) calculations in the homework input files.")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+    instrument.run_with_options(args, process_homework_files)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import numpy as np
+
+from . import instrument
+from .gf256 import EXP_TABLE, LOG_TABLE, INVERSE_TABLE, perform_calculation
+
+
+# Function that builds the full 256 x 256 GF(2^8) multiplication table (64 KB) from the log/exp tables
+def build_multiplication_table():
+    exp = np.array(EXP_TABLE, dtype=np.uint8)
+    log = np.array(LOG_TABLE, dtype=np.intp)
+    table = exp[log[:, None] + log[None, :]]
+    table[0, :] = 0
+    table[:, 0] = 0
+    return table
+
+
+# Lookup tables as NumPy arrays, built once when the module is loaded
+MUL_TABLE = build_multiplication_table()
+MUL_FLAT = MUL_TABLE.ravel()  # MUL_FLAT[(a << 8) | b] == a * b
+INVERSE_ARRAY = np.array(INVERSE_TABLE, dtype=np.uint8)
+
+
+# Function that views bytes, bytearray, memoryview or array input as a uint8 array (no copy for bytes-like input)
+def as_array(data):
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(data, dtype=np.uint8)
+    return np.asarray(data, dtype=np.uint8)
+
+
+# Function that tells whether an operand is a single field element rather than a buffer
+def is_scalar(value):
+    return isinstance(value, (int, np.integer))
+
+
+# Function that performs addition in GF(2^8) (XOR) over whole buffers, or a scalar and a buffer
+def add_GF_array(a, b):
+    return np.bitwise_xor(a if is_scalar(a) else as_array(a), b if is_scalar(b) else as_array(b)).astype(np.uint8)
+
+
+# Subtraction in GF(2^8) is the same as addition
+subtract_GF_array = add_GF_array
+
+
+# Function that performs multiplication in GF(2^8) over whole buffers, or a scalar and a buffer
+def multiply_GF_array(a, b):
+    if is_scalar(a) and is_scalar(b):
+        return np.uint8(MUL_TABLE[a, b])
+
+    # A constant coefficient selects one 256-byte row of the table, which is then gathered
+    if is_scalar(a):
+        return MUL_TABLE[a][as_array(b)]
+    if is_scalar(b):
+        return MUL_TABLE[b][as_array(a)]
+
+    index = as_array(a).astype(np.uint16) << 8
+    index |= as_array(b)
+    return MUL_FLAT[index]
+
+
+# Function that performs division in GF(2^8) (multiplication by the inverse) over whole buffers
+def divide_GF_array(a, b):
+    if is_scalar(b):
+        if b == 0:
+            raise ValueError("Division by zero in GF(2^8)")
+        return multiply_GF_array(a, int(INVERSE_ARRAY[b]))
+
+    b = as_array(b)
+    if not b.all():
+        raise ValueError("Division by zero in GF(2^8)")
+    return multiply_GF_array(a, INVERSE_ARRAY[b])
+
+
+# Bytes read from the input file per chunk in process_files_bulk
+FILE_CHUNK_SIZE = 1 << 22
+
+# "dddddddd dddddddd o" - the fixed-width line layout handled without Python per-line work
+LINE_WIDTH = 19
+BIT_WEIGHTS = np.array([128, 64, 32, 16, 8, 4, 2, 1], dtype=np.uint8)
+
+# Output line for every byte value, e.g. BINARY_LINES[5] == b"00000101\n"
+BINARY_LINES = np.frombuffer(b"".join(format(n, '08b').encode() + b"\n" for n in range(256)),
+                             dtype=np.uint8).reshape(256, 9)
+
+DIVISION_BY_ZERO_LINE = "Error: Division by zero in GF(2^8)\n"
+
+
+# Status codes used by process_chunk for lines that are not a plain result byte
+SLOW_LINE = -1  # Goes through perform_calculation
+ERROR_LINE = -2  # Fixed-width line whose result is an error message
+
+
+# Function that parses the fixed-width lines of a chunk and computes them, grouped by operator.
+# Returns an array with the result byte of each line, or SLOW_LINE / ERROR_LINE.
+def compute_fixed_lines(buffer, starts, lengths):
+    status = np.full(len(starts), SLOW_LINE, dtype=np.int64)
+
+    # Lines of exactly LINE_WIDTH characters, optionally followed by '\r'
+    has_cr = np.zeros(len(starts), dtype=bool)
+    long_lines = lengths == LINE_WIDTH + 1
+    has_cr[long_lines] = buffer[starts[long_lines] + LINE_WIDTH] == ord('\r')
+    fixed = np.flatnonzero((lengths == LINE_WIDTH) | has_cr)
+
+    rows = buffer[starts[fixed, None] + np.arange(LINE_WIDTH)]
+    bits = np.concatenate([rows[:, 0:8], rows[:, 9:17]], axis=1) - ord('0')  # Non-digits wrap to > 1
+    op = rows[:, 18]
+    layout_ok = ((bits <= 1).all(axis=1) & (rows[:, 8] == ord(' ')) & (rows[:, 17] == ord(' '))
+                 & (op > ord(' ')) & (op < 0x7f))
+    fixed, bits, op = fixed[layout_ok], bits[layout_ok], op[layout_ok]
+
+    a = (bits[:, 0:8] * BIT_WEIGHTS).sum(axis=1, dtype=np.uint8)
+    b = (bits[:, 8:16] * BIT_WEIGHTS).sum(axis=1, dtype=np.uint8)
+
+    results = np.full(len(fixed), ERROR_LINE, dtype=np.int64)
+    additive = (op == ord('+')) | (op == ord('-'))
+    results[additive] = a[additive] ^ b[additive]
+    product = op == ord('*')
+    results[product] = multiply_GF_array(a[product], b[product])
+    quotient = (op == ord('/')) & (b != 0)
+    results[quotient] = divide_GF_array(a[quotient], b[quotient])
+
+    # Division by zero and unknown operators stay ERROR_LINE and get their message later
+    status[fixed] = results
+    return status
+
+
+# Function that turns one chunk of whole lines into its output text
+def process_chunk(chunk):
+    buffer = np.frombuffer(chunk, dtype=np.uint8)
+    ends = np.flatnonzero(buffer == ord('\n'))
+    starts = np.concatenate([[0], ends[:-1] + 1])
+    with instrument.stage("gf.bulk.compute"):
+        status = compute_fixed_lines(buffer, starts, ends - starts)
+    if instrument.ENABLED:
+        instrument.count("gf.lines", len(starts))
+        instrument.count("gf.bulk.slow_lines", int((status == SLOW_LINE).sum()))
+
+    with instrument.stage("gf.bulk.format"):
+        # Write runs of result lines as one block; other lines are handled one at a time
+        pieces = []
+        previous = 0
+        for line in np.flatnonzero(status < 0):
+            if line > previous:
+                pieces.append(BINARY_LINES[status[previous:line]].tobytes().decode('ascii'))
+            previous = line + 1
+
+            if status[line] == ERROR_LINE:
+                op = chr(buffer[starts[line] + 18])
+                pieces.append(DIVISION_BY_ZERO_LINE if op == '/' else f"Error: Unknown operation {op}\n")
+                continue
+
+            # Same line splitting, blank-line skipping and error handling as process_files
+            text = chunk[starts[line]:ends[line]].decode()
+            for piece in text.replace('\r\n', '\n').replace('\r', '\n').split('\n'):
+                if piece.strip():
+                    pieces.append(f"{perform_calculation(piece)}\n")
+        if previous < len(starts):
+            pieces.append(BINARY_LINES[status[previous:]].tobytes().decode('ascii'))
+
+    return "".join(pieces)
+
+
+# Function that processes all calculations from input file in bulk; writes to output file.
+# Produces the same output as process_files, with one buffered write per chunk.
+def process_files_bulk(input_file_path, output_file_path, chunk_size=FILE_CHUNK_SIZE):
+    with open(input_file_path, 'rb') as infile, open(output_file_path, 'w') as outfile:
+        carry = b""
+        while True:
+            with instrument.stage("gf.bulk.read"):
+                data = infile.read(chunk_size)
+            if not data:
+                break
+            instrument.count("gf.bulk.bytes", len(data))
+
+            # Only process whole lines; a partial last line waits for the next chunk
+            chunk = carry + data
+            cut = chunk.rfind(b"\n") + 1
+            chunk, carry = chunk[:cut], chunk[cut:]
+            if chunk:
+                text = process_chunk(chunk)
+                with instrument.stage("gf.bulk.write"):
+                    outfile.write(text)
+
+        # The last line may have no trailing newline
+        if carry:
+            outfile.write(process_chunk(carry + b"\n"))
+
+
+if __name__ == "__main__":
+    import os
+
+    from .homework import HOMEWORK_3
+
+    process_files_bulk(os.path.join(HOMEWORK_3, "class_input_5C.txt"), os.path.join(HOMEWORK_3, "class_output_5C.txt"))
+    process_files_bulk(os.path.join(HOMEWORK_3, "reyes_input_5C.txt"), os.path.join(HOMEWORK_3, "reyes_output_5C.txt"))
@@ -0,0 +1,91 @@
+import numpy as np
+
+from .gf_bulk import INVERSE_ARRAY, MUL_TABLE
+
+
+# Function that converts a nested list or array into a uint8 matrix, checking it is 2-D
+def as_matrix(values):
+    matrix = np.array(values, dtype=np.uint8)  # Always a copy, so callers' data is never modified
+    if matrix.ndim != 2:
+        raise ValueError(f"Expected a 2-D matrix, got shape {matrix.shape}")
+    return matrix
+
+
+# Function that multiplies two matrices over GF(2^8); each step is one table-lookup pass over a row
+def matrix_multiply(a, b):
+    a, b = as_matrix(a), as_matrix(b)
+    if a.shape[1] != b.shape[0]:
+        raise ValueError(f"Cannot multiply matrices of shapes {a.shape} and {b.shape}")
+
+    # C is the XOR (GF(2^8) sum) over k of column k of A times row k of B
+    product = np.zeros((a.shape[0], b.shape[1]), dtype=np.uint8)
+    for k in range(a.shape[1]):
+        product ^= MUL_TABLE[:, b[k]][a[:, k]]
+    return product
+
+
+# Function that runs Gauss-Jordan elimination in place on the first `columns` columns of a matrix.
+# Returns the pivot columns found; rows are scaled so every pivot is 1.
+def eliminate(matrix, columns):
+    rows = matrix.shape[0]
+    pivots = []
+    pivot_row = 0
+    for col in range(columns):
+        if pivot_row == rows:
+            break
+        candidates = np.flatnonzero(matrix[pivot_row:, col])
+        if len(candidates) == 0:
+            continue
+
+        # Move the pivot up and scale its row so the pivot becomes 1
+        found = pivot_row + candidates[0]
+        if found != pivot_row:
+            matrix[[pivot_row, found]] = matrix[[found, pivot_row]]
+        matrix[pivot_row] = MUL_TABLE[INVERSE_ARRAY[matrix[pivot_row, col]]][matrix[pivot_row]]
+
+        # Clear the column in every other row: build every multiple of the pivot row with one
+        # table lookup, then pick the right multiple for each row (the pivot row is 0 left of col)
+        factors = matrix[:, col].copy()
+        factors[pivot_row] = 0
+        multiples = MUL_TABLE[:, matrix[pivot_row, col:]]
+        matrix[:, col:] ^= multiples[factors]
+
+        pivots.append(col)
+        pivot_row += 1
+    return pivots
+
+
+# Function that finds the rank of a matrix over GF(2^8)
+def matrix_rank(a):
+    a = as_matrix(a)
+    return len(eliminate(a, a.shape[1]))
+
+
+# Function that finds the inverse of a square matrix over GF(2^8)
+def matrix_inverse(a):
+    a = as_matrix(a)
+    size = a.shape[0]
+    if a.shape[1] != size:
+        raise ValueError(f"Only square matrices can be inverted, got shape {a.shape}")
+
+    augmented = np.concatenate([a, np.eye(size, dtype=np.uint8)], axis=1)
+    if len(eliminate(augmented, size)) != size:
+        raise ValueError("Matrix is singular in GF(2^8)")
+    return augmented[:, size:]
+
+
+# Function that solves A x = b over GF(2^8) for a square, invertible A (b may be a vector or a matrix)
+def solve(a, b):
+    a = as_matrix(a)
+    size = a.shape[0]
+    if a.shape[1] != size:
+        raise ValueError(f"Only square systems can be solved, got shape {a.shape}")
+
+    b = np.array(b, dtype=np.uint8)
+    is_vector = b.ndim == 1
+    augmented = np.concatenate([a, b.reshape(size, -1)], axis=1)
+    if len(eliminate(augmented, size)) != size:
+        raise ValueError("Matrix is singular in GF(2^8)")
+
+    solution = augmented[:, size:]
+    return solution.ravel() if is_vector else solution
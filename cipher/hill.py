@@ -0,0 +1,255 @@
+import threading
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+
+from . import instrument
+from .letter_codec import numbers_to_text, text_to_numbers
+
+
+# Letter number used to pad the last block ('X')
+PAD_NUMBER = ord('X') - ord('A')
+
+# Number of blocks multiplied at a time, which bounds the size of the int32 intermediate
+BLOCK_CHUNK = 1 << 20
+
+
+# Function that factors m into prime powers, e.g. 26 -> [(2, 2), (13, 13)]
+def prime_power_factors(m):
+    factors = []
+    p = 2
+    while p * p <= m:
+        if m % p == 0:
+            q = 1
+            while m % p == 0:
+                m //= p
+                q *= p
+            factors.append((p, q))
+        p += 1
+    if m > 1:
+        factors.append((m, m))
+    return factors
+
+
+# Function that inverts a matrix modulo q = p^e with integer Gauss-Jordan elimination (None if singular)
+def prime_power_inv(matrix, p, q):
+    size = matrix.shape[0]
+    augmented = np.concatenate([matrix % q, np.eye(size, dtype=np.int64)], axis=1)
+
+    for col in range(size):
+        # Any entry not divisible by p is a unit modulo p^e and can be the pivot
+        candidates = np.flatnonzero(augmented[col:, col] % p)
+        if len(candidates) == 0:
+            return None
+        pivot = col + candidates[0]
+        if pivot != col:
+            augmented[[col, pivot]] = augmented[[pivot, col]]
+
+        # Scale the pivot row to 1, then clear the column in every other row at once
+        augmented[col] = augmented[col] * pow(int(augmented[col, col]), -1, q) % q
+        multipliers = augmented[:, col].copy()
+        multipliers[col] = 0
+        augmented = (augmented - np.outer(multipliers, augmented[col])) % q
+
+    return augmented[:, size:]
+
+
+# Function that finds the modular inverse of a matrix under modulo m (m below 2^31 so int64 cannot overflow)
+def mod_inv(matrix, m):
+    matrix = np.asarray(matrix, dtype=np.int64)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(f"Key matrix must be square, got shape {matrix.shape}.")
+
+    instrument.count("hill.inversions")
+
+    # Invert modulo each prime power of m (2 and 13 for 26), then combine with the Chinese Remainder Theorem
+    inverse = np.zeros_like(matrix)
+    with instrument.stage("hill.mod_inv"):
+        for p, q in prime_power_factors(m):
+            partial = prime_power_inv(matrix, p, q)
+            if partial is None:
+                raise ValueError(f"Key matrix is not invertible modulo {m} (it is singular modulo {p}). "
+                                 f"Choose a different key matrix.")
+            cofactor = m // q
+            inverse = (inverse + partial * (cofactor * pow(cofactor, -1, q) % m)) % m
+
+    return inverse.astype(int)
+
+
+# Function that converts a key string into a square matrix for Hill Cipher
+def key_string_to_matrix(key_string):
+    if not key_string:
+        raise ValueError("Invalid key. It must not be empty!")
+    key_numbers = [ord(char.upper()) - ord('A') for char in key_string]
+    size = int(len(key_numbers) ** 0.5)  # Determine matrix size
+    if size * size != len(key_numbers):
+        raise ValueError("Invalid key length. It must be a perfect square!")
+
+    return np.array(key_numbers).reshape(size, size)  # Reshape into a square matrix
+
+
+# Function that multiplies every block of the message by the given matrix in batched matmuls
+def transform_blocks(numbers, matrix):
+    block_size = matrix.shape[0]
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    if len(numbers) % block_size != 0:
+        raise ValueError(f"Message length ({len(numbers)}) is not a multiple of the block size ({block_size}).")
+
+    # Row i of blocks is the i-th block, so blocks @ matrix.T applies the matrix to every block at once
+    blocks = numbers.reshape(-1, block_size)
+    matrix_t = (np.asarray(matrix) % 26).astype(np.int32).T
+    transformed = np.empty_like(blocks)
+    instrument.count("hill.blocks", len(blocks))
+    with instrument.stage("hill.transform"):
+        for start in range(0, len(blocks), BLOCK_CHUNK):
+            chunk = blocks[start:start + BLOCK_CHUNK].astype(np.int32)
+            transformed[start:start + BLOCK_CHUNK] = chunk @ matrix_t % 26
+    return transformed.ravel()
+
+
+# Function that pads the message numbers (with 'X') to a whole number of blocks
+def pad_numbers(numbers, block_size):
+    numbers = np.asarray(numbers, dtype=np.uint8)
+    padding = -len(numbers) % block_size
+    return np.concatenate([numbers, np.full(padding, PAD_NUMBER, dtype=np.uint8)])
+
+
+# Read-only key matrix and inverse derived from one key string (inverse is None if the key cannot decrypt)
+KeyMaterial = namedtuple("KeyMaterial", ["matrix", "inverse", "inverse_error"])
+
+
+# Function that turns a key string or key matrix into the key string used by the cache
+def canonical_key(key):
+    if isinstance(key, str):
+        return key.upper()
+    matrix = np.asarray(key, dtype=np.int64) % 26
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1]:
+        raise ValueError(f"Key matrix must be square, got shape {matrix.shape}.")
+    return numbers_to_text(matrix.ravel())
+
+
+# Function that validates a key and computes everything encrypt/decrypt need from it
+def derive_key_material(key_string):
+    matrix = key_string_to_matrix(key_string).astype(np.int64)
+    if not ((matrix >= 0) & (matrix < 26)).all():
+        raise ValueError(f"Invalid key {key_string!r}. It must only contain letters A-Z.")
+
+    # The cache hands the same arrays to every caller, so they are made read-only
+    matrix.flags.writeable = False
+    try:
+        inverse = mod_inv(matrix, 26).astype(np.int64)
+    except ValueError as e:
+        return KeyMaterial(matrix, None, str(e))
+    inverse.flags.writeable = False
+    return KeyMaterial(matrix, inverse, None)
+
+
+# Bounded, thread-safe least-recently-used cache of derived key material
+class KeyCache:
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    # Returns the key material for a key string or matrix, deriving it on a miss
+    def get(self, key):
+        key_string = canonical_key(key)
+        with self.lock:
+            material = self.entries.get(key_string)
+            if material is not None:
+                self.entries.move_to_end(key_string)
+                self.hits += 1
+                instrument.count("hill.key_cache.hits")
+                return material
+            self.misses += 1
+        instrument.count("hill.key_cache.misses")
+
+        # Derive outside the lock so other keys are not blocked by a slow inversion
+        material = derive_key_material(key_string)
+        with self.lock:
+            self.entries[key_string] = material
+            self.entries.move_to_end(key_string)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+                instrument.count("hill.key_cache.evictions")
+        return material
+
+    # Loads every key in a file (one key string per line) into the cache
+    def prewarm(self, filename):
+        with open(filename, 'r') as file:
+            for line in file:
+                if line.strip():
+                    self.get(line.strip())
+
+    # Returns the hit/miss/eviction counters
+    def stats(self):
+        with self.lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self.entries), "maxsize": self.maxsize}
+
+    # Empties the cache and resets the counters
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+
+# Shared cache used by encrypt and decrypt
+KEY_CACHE = KeyCache()
+
+
+# Function that returns the cached key material for a key string or matrix
+def key_material(key):
+    return KEY_CACHE.get(key)
+
+
+# Function that returns the cached inverse of a key, raising if the key cannot decrypt
+def inverse_key(key):
+    material = key_material(key)
+    if material.inverse is None:
+        raise ValueError(material.inverse_error)
+    return material.inverse
+
+
+# Function that encrypts the message using Hill Cipher (key can be a key string or matrix)
+def encrypt(message, key_matrix):
+    key_matrix = key_material(key_matrix).matrix
+    instrument.count("hill.chars", len(message))
+    with instrument.stage("hill.text_to_numbers"):
+        message_numbers, positions = text_to_numbers(message)
+        message_numbers = pad_numbers(message_numbers, key_matrix.shape[0])
+
+    encrypted_numbers = transform_blocks(message_numbers, key_matrix)
+    with instrument.stage("hill.numbers_to_text"):
+        return numbers_to_text(encrypted_numbers), positions
+
+
+# Function that decrypt the message using Hill Cipher (key can be a key string or matrix)
+def decrypt(encrypted_message, key_matrix, positions=None):
+    instrument.count("hill.chars", len(encrypted_message))
+    with instrument.stage("hill.text_to_numbers"):
+        encrypted_numbers, _ = text_to_numbers(encrypted_message)
+
+    # Look up the modular inverse of the key matrix
+    inv_key_matrix = inverse_key(key_matrix)
+
+    decrypted_numbers = transform_blocks(encrypted_numbers, inv_key_matrix)
+    with instrument.stage("hill.numbers_to_text"):
+        return numbers_to_text(decrypted_numbers, positions)
+
+
+# Example usage
+if __name__ == "__main__":
+    given_matrix = np.array([[3, 3], [2, 5]])
+
+    plaintext = "HELLO WORLD"
+
+    encrypted_text, space_positions = encrypt(plaintext, given_matrix)
+    print("Encrypted Message:", encrypted_text)
+
+    decrypted_text = decrypt(encrypted_text, given_matrix, space_positions)
+    print("Decrypted Message:", decrypted_text)
@@ -0,0 +1,237 @@
+import itertools
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from .caesar import ENGLISH_FREQUENCIES
+from .hill import canonical_key, mod_inv, pad_numbers, prime_power_factors, prime_power_inv
+from .letter_codec import numbers_to_text, text_to_numbers
+
+# Log frequencies of single English letters
+UNIGRAM_LOG = np.log(ENGLISH_FREQUENCIES)
+
+# Percent frequencies of the most common English bigrams; every other pair gets BIGRAM_FLOOR
+COMMON_BIGRAMS = {
+    "TH": 3.56, "HE": 3.07, "IN": 2.43, "ER": 2.05, "AN": 1.99, "RE": 1.85, "ON": 1.76, "AT": 1.49,
+    "EN": 1.45, "ND": 1.35, "TI": 1.34, "ES": 1.34, "OR": 1.28, "TE": 1.20, "OF": 1.17, "ED": 1.17,
+    "IS": 1.13, "IT": 1.12, "AL": 1.09, "AR": 1.07, "ST": 1.05, "TO": 1.04, "NT": 1.04, "NG": 0.95,
+    "SE": 0.93, "HA": 0.93, "AS": 0.87, "OU": 0.87, "IO": 0.83, "LE": 0.83, "VE": 0.83, "CO": 0.79,
+    "ME": 0.79, "DE": 0.76, "HI": 0.76, "RI": 0.73, "RO": 0.73, "IC": 0.70, "NE": 0.69, "EA": 0.69,
+    "RA": 0.69, "CE": 0.65, "LI": 0.62, "CH": 0.60, "LL": 0.58, "BE": 0.58, "MA": 0.57, "SI": 0.55,
+    "OM": 0.55, "UR": 0.54,
+}
+BIGRAM_FLOOR = 0.02
+BIGRAM_LOG = np.full((26, 26), np.log(BIGRAM_FLOOR / 100))
+for pair, percent in COMMON_BIGRAMS.items():
+    BIGRAM_LOG[ord(pair[0]) - ord('A'), ord(pair[1]) - ord('A')] = np.log(percent / 100)
+
+# Number of candidate rows scored per batch (and per task sent to the process pool)
+ROW_BATCH_SIZE = 2048
+
+# Number of ciphertext blocks used to score candidates
+SAMPLE_BLOCKS = 2000
+
+
+# Function that picks the first block_size rows that are linearly independent modulo a prime p
+def independent_rows(blocks, p):
+    block_size = blocks.shape[1]
+    basis = []  # Reduced rows with their pivot column
+    chosen = []
+
+    for index, row in enumerate(blocks % p):
+        # Reduce the candidate against the rows already chosen
+        row = row.copy()
+        for pivot, basis_row in basis:
+            if row[pivot]:
+                row = (row - row[pivot] * basis_row) % p
+        nonzero = np.flatnonzero(row)
+        if len(nonzero) == 0:
+            continue
+
+        pivot = nonzero[0]
+        basis.append((pivot, row * pow(int(row[pivot]), -1, p) % p))
+        chosen.append(index)
+        if len(chosen) == block_size:
+            return chosen
+
+    return None
+
+
+# Function that recovers a Hill key from aligned plaintext and ciphertext (known-plaintext attack)
+def recover_hill_key(plaintext, ciphertext, block_size):
+    """
+    Parameters:
+    - plaintext (str): The known plaintext (non-letters are ignored, padded with 'X' like encrypt).
+    - ciphertext (str): The matching ciphertext.
+    - block_size (int): The size k of the k x k key matrix.
+
+    Returns:
+    - numpy.ndarray: The k x k key matrix that maps every plaintext block to its ciphertext block.
+    """
+    plain_numbers = pad_numbers(text_to_numbers(plaintext)[0], block_size).astype(np.int64)
+    cipher_numbers = np.asarray(text_to_numbers(ciphertext)[0], dtype=np.int64)
+    usable = min(len(plain_numbers), len(cipher_numbers)) // block_size * block_size
+    if usable == 0:
+        raise ValueError("Not enough aligned text to recover a key.")
+
+    # Row i of each array is the i-th block, so cipher_blocks = plain_blocks @ key.T (mod 26)
+    plain_blocks = plain_numbers[:usable].reshape(-1, block_size)
+    cipher_blocks = cipher_numbers[:usable].reshape(-1, block_size)
+
+    # Solve modulo each prime power of 26 with its own invertible block set, then combine with the CRT
+    key_transposed = np.zeros((block_size, block_size), dtype=np.int64)
+    for p, q in prime_power_factors(26):
+        rows = independent_rows(plain_blocks, p)
+        if rows is None:
+            raise ValueError(f"Plaintext blocks do not span the key space modulo {p}. Provide more known text.")
+
+        inverse = prime_power_inv(plain_blocks[rows], p, q)
+        partial = inverse @ cipher_blocks[rows] % q
+        cofactor = 26 // q
+        key_transposed = (key_transposed + partial * (cofactor * pow(cofactor, -1, q) % 26)) % 26
+
+    key_matrix = key_transposed.T
+
+    # Check the key against every block in one batched matmul
+    if not (plain_blocks @ key_transposed % 26 == cipher_blocks).all():
+        raise ValueError("Recovered key does not match all blocks. The texts may not be aligned.")
+
+    return key_matrix
+
+
+# Function that returns candidate rows start..stop-1, each row being the base-26 digits of its index
+def candidate_rows(start, stop, block_size):
+    indices = np.arange(start, stop, dtype=np.int64)
+    powers = 26 ** np.arange(block_size - 1, -1, -1, dtype=np.int64)
+    return indices[:, None] // powers % 26
+
+
+# Function that scores a batch of candidate inverse-key rows and keeps the best ones
+def score_row_batch(start, stop, cipher_blocks, keep):
+    rows = candidate_rows(start, stop, cipher_blocks.shape[1])
+
+    # A row of an invertible matrix cannot be all even or all multiples of 13
+    usable = (rows % 2).any(axis=1) & (rows % 13).any(axis=1)
+    rows = rows[usable]
+
+    # Each row produces one plaintext letter per block; score those letters against English
+    letters = rows @ cipher_blocks.T % 26
+    scores = UNIGRAM_LOG[letters].sum(axis=1)
+
+    if len(scores) > keep:
+        best = np.argpartition(scores, -keep)[-keep:]
+        rows, scores = rows[best], scores[best]
+    return rows, scores, stop - start
+
+
+# Function that scores whole plaintexts by English bigram fitness (higher is better)
+def bigram_fitness(letters):
+    return BIGRAM_LOG[letters[..., :-1], letters[..., 1:]].sum(axis=-1)
+
+
+# Function that brute-forces a small Hill key from ciphertext alone
+def brute_force_hill(ciphertext, block_size, top_rows=12, results=5, workers=None, progress=None):
+    """
+    Parameters:
+    - ciphertext (str): The intercepted ciphertext.
+    - block_size (int): The size k of the key matrix (2 or 3 is practical).
+    - top_rows (int): How many of the best inverse-key rows are combined into full keys.
+    - results (int): How many candidate keys to return.
+    - workers (int): Processes used to score rows. Defaults to the number of CPUs.
+    - progress (callable): Receives progress messages (e.g. print). Defaults to None for silence.
+
+    Returns:
+    - list: (fitness, key_matrix, plaintext) tuples, best candidate first.
+    """
+    cipher_numbers = np.asarray(text_to_numbers(ciphertext)[0], dtype=np.int64)
+    usable = len(cipher_numbers) // block_size * block_size
+    if usable == 0:
+        raise ValueError("Ciphertext is shorter than one block.")
+    cipher_blocks = cipher_numbers[:usable].reshape(-1, block_size)
+    sample = cipher_blocks[:SAMPLE_BLOCKS]
+
+    # Stage 1: every row of the inverse key decrypts one letter per block, so rows are scored on their own
+    total_rows = 26 ** block_size
+    batches = [(start, min(start + ROW_BATCH_SIZE, total_rows)) for start in range(0, total_rows, ROW_BATCH_SIZE)]
+    workers = workers or os.cpu_count() or 1
+
+    started = time.perf_counter()
+    kept_rows, kept_scores, done = [], [], 0
+    if workers == 1 or len(batches) == 1:
+        outcomes = (score_row_batch(start, stop, sample, top_rows) for start, stop in batches)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        outcomes = (future.result() for future in
+                    as_completed([pool.submit(score_row_batch, start, stop, sample, top_rows)
+                                  for start, stop in batches]))
+    try:
+        for rows, scores, count in outcomes:
+            kept_rows.append(rows)
+            kept_scores.append(scores)
+            done += count
+            if progress:
+                elapsed = time.perf_counter() - started
+                progress(f"Scored {done}/{total_rows} rows ({done / max(elapsed, 1e-9):,.0f} rows/s)")
+    finally:
+        if pool:
+            pool.shutdown()
+    rows_elapsed = time.perf_counter() - started
+
+    rows = np.concatenate(kept_rows)
+    scores = np.concatenate(kept_scores)
+    best_rows = rows[np.argsort(scores)[::-1][:top_rows]]
+
+    # Stage 2: try every ordered choice of distinct top rows as the inverse key and score with bigrams
+    keys_started = time.perf_counter()
+    combinations = np.array(list(itertools.permutations(range(len(best_rows)), block_size)))
+    inverse_keys = best_rows[combinations]  # Shape (candidates, k, k)
+    letters = np.einsum('bj,cij->cbi', sample, inverse_keys).reshape(len(inverse_keys), -1) % 26
+    fitness = bigram_fitness(letters)
+
+    candidates = []
+    for index in np.argsort(fitness)[::-1]:
+        try:
+            key_matrix = mod_inv(inverse_keys[index], 26)
+        except ValueError:
+            continue  # Rows that do not form an invertible matrix cannot be a key
+        plaintext = numbers_to_text((cipher_blocks @ inverse_keys[index].T % 26).ravel())
+        candidates.append((float(fitness[index]), key_matrix, plaintext))
+        if len(candidates) == results:
+            break
+
+    if progress:
+        keys_elapsed = time.perf_counter() - keys_started
+        progress(f"Checked {total_rows} rows in {rows_elapsed:.2f}s "
+                 f"({total_rows / max(rows_elapsed, 1e-9):,.0f} rows/s) and {len(inverse_keys)} full keys "
+                 f"in {keys_elapsed:.2f}s ({len(inverse_keys) / max(keys_elapsed, 1e-9):,.0f} keys/s)")
+    return candidates
+
+
+# Example usage
+if __name__ == "__main__":
+    import os
+
+    from .homework import HOMEWORK_1
+
+    with open(os.path.join(HOMEWORK_1, "Test_Input_5d.txt"), "r") as file:
+        known_plaintext = file.readlines()[1].strip()
+    with open(os.path.join(HOMEWORK_1, "Reyes_Output_5d.txt"), "r") as file:
+        known_ciphertext = file.read().strip()
+
+    recovered = recover_hill_key(known_plaintext, known_ciphertext, 3)
+    print("Recovered key matrix:")
+    print(recovered)
+    print("Recovered key string:", canonical_key(recovered))
+
+    # Ciphertext-only attack on the 2x2 key from part A
+    from .hill import encrypt
+    sample_text = ("Cryptography is the practice and study of techniques for secure communication in the presence "
+                   "of adversarial behavior. More generally it is about constructing and analyzing protocols that "
+                   "prevent third parties or the public from reading private messages.")
+    intercepted = encrypt(sample_text, np.array([[3, 3], [2, 5]]))[0]
+    fitness, key_matrix, plaintext = brute_force_hill(intercepted, 2, progress=print)[0]
+    print("Best key matrix:", key_matrix.tolist())
+    print("Plaintext:", plaintext)
@@ -0,0 +1,8 @@
+import os
+
+# Folders of the original homework projects, which sit next to the cipher package in the repository.
+# The demos in each module read and write the files there, whatever the current directory is.
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HOMEWORK_1 = os.path.join(ROOT, "Homework 1", "pythonProject3")
+HOMEWORK_2 = os.path.join(ROOT, "Homework 2", "pythonProject7")
+HOMEWORK_3 = os.path.join(ROOT, "Homework 3", "pythonProject8")
@@ -0,0 +1,143 @@
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+# Instrumentation is off unless enable() is called or CIPHER_METRICS=1 is set in the environment.
+# While it is off, count() returns at once and stage() hands back one shared no-op context manager.
+# Counts that take work to compute should be guarded with `if instrument.ENABLED:`.
+ENABLED = os.environ.get("CIPHER_METRICS", "") not in ("", "0")
+
+NULL_STAGE = nullcontext()
+
+_lock = threading.Lock()
+_counters = {}
+_stages = {}  # name -> [calls, total seconds, longest call in seconds]
+
+
+# Function that turns instrumentation on or off for the whole process
+def enable(on=True):
+    global ENABLED
+    ENABLED = on
+
+
+# Function that turns instrumentation off
+def disable():
+    enable(False)
+
+
+# Function that adds amount to a named counter (bytes processed, blocks, cache hits, ...)
+def count(name, amount=1):
+    if not ENABLED:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+# Times one run of a pipeline stage and adds it to the totals for that stage
+class Stage:
+    __slots__ = ("name", "start")
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self.start
+        with _lock:
+            totals = _stages.get(self.name)
+            if totals is None:
+                _stages[self.name] = [1, elapsed, elapsed]
+            else:
+                totals[0] += 1
+                totals[1] += elapsed
+                totals[2] = max(totals[2], elapsed)
+        return False
+
+
+# Function that returns a context manager timing the named stage (a no-op while disabled)
+def stage(name):
+    return Stage(name) if ENABLED else NULL_STAGE
+
+
+# Function that clears every counter and stage total
+def reset():
+    with _lock:
+        _counters.clear()
+        _stages.clear()
+
+
+# Function that returns a copy of the current counters and stage totals
+def snapshot():
+    with _lock:
+        return {
+            "counters": dict(sorted(_counters.items())),
+            "stages": {name: {"calls": calls, "seconds": seconds, "max_seconds": longest}
+                       for name, (calls, seconds, longest) in sorted(_stages.items())},
+        }
+
+
+# Function that formats a snapshot as JSON
+def to_json(data=None, indent=2):
+    import json
+
+    return json.dumps(snapshot() if data is None else data, indent=indent)
+
+
+# Function that formats a snapshot in the Prometheus text exposition format
+def to_prometheus(data=None, prefix="cipher"):
+    data = snapshot() if data is None else data
+    lines = []
+    for name, value in data["counters"].items():
+        metric = f"{prefix}_{name.replace('.', '_')}_total"
+        lines += [f"# TYPE {metric} counter", f"{metric} {value}"]
+
+    metrics = [("stage_calls_total", "counter", "calls"), ("stage_seconds_total", "counter", "seconds"),
+               ("stage_max_seconds", "gauge", "max_seconds")]
+    for suffix, kind, field in metrics:
+        if data["stages"]:
+            lines.append(f"# TYPE {prefix}_{suffix} {kind}")
+        for name, totals in data["stages"].items():
+            lines.append(f'{prefix}_{suffix}{{stage="{name}"}} {totals[field]}')
+    return "\n".join(lines) + "\n"
+
+
+# Function that writes a snapshot to a file: Prometheus text for .prom/.txt, JSON otherwise
+def write_snapshot(path):
+    text = to_prometheus() if path.endswith((".prom", ".txt")) else to_json() + "\n"
+    with open(path, "w") as file:
+        file.write(text)
+
+
+# Function that adds the --profile and --metrics options shared by the command-line drivers
+def add_arguments(parser):
+    parser.add_argument("--profile", metavar="FILE", help="save cProfile stats for this run to FILE")
+    parser.add_argument("--metrics", metavar="FILE",
+                        help="record stage timers and counters and save them to FILE (.prom for Prometheus text)")
+
+
+# Function that runs a driver's work with the --profile and --metrics options applied
+def run_with_options(args, func, *func_args, **func_kwargs):
+    if args.metrics:
+        enable()
+    try:
+        if args.profile:
+            return profile_call(args.profile, func, *func_args, **func_kwargs)
+        return func(*func_args, **func_kwargs)
+    finally:
+        if args.metrics:
+            write_snapshot(args.metrics)
+
+
+# Function that runs func under cProfile and saves the stats to path (for pstats, snakeviz or flameprof)
+def profile_call(path, func, *args, **kwargs):
+    import cProfile
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
@@ -0,0 +1,75 @@
+from collections import namedtuple
+
+import numpy as np
+
+# Lookup table from letter numbers (0-25) to their ASCII codes
+LETTERS = np.frombuffer(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype=np.uint8)
+
+# Offsets and characters of everything in a message that is not a letter A-Z
+Positions = namedtuple("Positions", ["offsets", "symbols"])
+
+
+# Function that splits a string into a code point array (1 byte per character for ASCII text)
+def text_to_codes(text):
+    if text.isascii():
+        return np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+    return np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+
+
+# Function that turns a code point array back into a string
+def codes_to_text(codes):
+    return codes.tobytes().decode('ascii' if codes.dtype == np.uint8 else 'utf-32-le')
+
+
+# Function that returns, for every code, its letter number (0-25) or 255 for anything that is not A-Z/a-z
+def letter_numbers(codes):
+    # Setting bit 0x20 folds uppercase onto lowercase; only A-Z and a-z then land in a-z
+    numbers = (codes | 0x20) - ord('a')
+    numbers[numbers >= 26] = 255  # Also catches non-letters that wrapped around below 'a'
+    return numbers.astype(np.uint8)
+
+
+# Function that converts text or bytes to a uint8 buffer of letter numbers, dropping everything else
+def letter_indices(data):
+    if isinstance(data, str):
+        data = data.encode('ascii', 'ignore')  # Only ASCII letters have a letter number
+    numbers = letter_numbers(np.frombuffer(data, dtype=np.uint8))
+    return numbers[numbers != 255]
+
+
+# Function that converts text to numbers, remembering where every non-letter character was
+def text_to_numbers(text):
+    # Uppercasing can change the length of non-ASCII text (e.g. 'ß' -> 'SS'), so offsets refer to the uppercased text
+    codes = text_to_codes(text if text.isascii() else text.upper())
+    numbers = letter_numbers(codes)
+    is_letter = numbers != 255
+
+    offsets = np.flatnonzero(~is_letter)
+    if len(codes) < 2 ** 32:
+        offsets = offsets.astype(np.uint32)
+    return numbers[is_letter], Positions(offsets, codes_to_text(codes[~is_letter]))
+
+
+# Function that converts numbers back to text, putting the saved non-letter characters back in one pass
+def numbers_to_text(numbers, positions=None):
+    letters = LETTERS[np.asarray(numbers)]
+
+    # Accept the {position: character} dictionaries used by the homework scripts
+    if isinstance(positions, dict):
+        offsets = sorted(positions)
+        positions = Positions(np.array(offsets, dtype=np.int64), ''.join(positions[i] for i in offsets))
+
+    if positions is None or not positions.symbols:
+        return letters.tobytes().decode('ascii')
+
+    # A character saved past the end of the letters lands right after the ones before it
+    count = len(positions.symbols)
+    offsets = np.minimum(positions.offsets, len(letters) + np.arange(count))
+
+    symbols = text_to_codes(positions.symbols)
+    output = np.empty(len(letters) + count, dtype=symbols.dtype)
+    is_symbol = np.zeros(len(output), dtype=bool)
+    is_symbol[offsets] = True
+    output[offsets] = symbols
+    output[~is_symbol] = letters
+    return codes_to_text(output)
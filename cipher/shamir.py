@@ -0,0 +1,85 @@
+import os
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .gf_bulk import MUL_TABLE, as_array
+from .gf256 import divide_GF, multiply_GF
+
+# Bytes of the secret handled per pass, which bounds the memory used for random coefficients
+SHARE_CHUNK_SIZE = 1 << 22
+
+# One share: the evaluation point x (1-255) and the polynomial values for every byte of the secret
+Share = namedtuple("Share", ["x", "data"])
+
+
+# Function that splits a secret into `shares` shares, any `threshold` of which can rebuild it
+def split(secret, threshold, shares):
+    if not 1 <= threshold <= shares <= 255:
+        raise ValueError("Need 1 <= threshold <= shares <= 255")
+
+    secret = as_array(secret)
+    outputs = [np.empty(len(secret), dtype=np.uint8) for _ in range(shares)]
+    for start in range(0, len(secret), SHARE_CHUNK_SIZE):
+        chunk = secret[start:start + SHARE_CHUNK_SIZE]
+
+        # Each byte gets its own random polynomial whose constant term is the secret byte
+        coefficients = np.frombuffer(os.urandom((threshold - 1) * len(chunk)), dtype=np.uint8)
+        coefficients = coefficients.reshape(threshold - 1, len(chunk))
+
+        # Horner's method; multiplying by the constant x is one gather from its table row
+        for x, output in enumerate(outputs, start=1):
+            row = MUL_TABLE[x]
+            value = coefficients[-1] if threshold > 1 else chunk
+            for k in range(threshold - 3, -2, -1):
+                value = row[value] ^ (coefficients[k] if k >= 0 else chunk)
+            output[start:start + len(chunk)] = value
+
+    return [Share(x, output.tobytes()) for x, output in enumerate(outputs, start=1)]
+
+
+# Function that finds the Lagrange basis coefficients that evaluate the polynomial at x = 0
+def lagrange_coefficients(points):
+    coefficients = []
+    for j, xj in enumerate(points):
+        numerator, denominator = 1, 1
+        for m, xm in enumerate(points):
+            if m != j:
+                numerator = multiply_GF(numerator, xm)
+                denominator = multiply_GF(denominator, xm ^ xj)  # 0 - x_j is x_j, and x_m - x_j is x_m ^ x_j
+        coefficients.append(divide_GF(numerator, denominator))
+    return coefficients
+
+
+# Function that rebuilds the secret from at least `threshold` shares
+def combine(shares):
+    shares = [Share(*share) for share in shares]
+    points = [share.x for share in shares]
+    if not shares:
+        raise ValueError("At least one share is needed")
+    if len(set(points)) != len(points) or not all(1 <= x <= 255 for x in points):
+        raise ValueError("Share points must be distinct values between 1 and 255")
+    length = len(shares[0].data)
+    if any(len(share.data) != length for share in shares):
+        raise ValueError("All shares must have the same length")
+
+    # Each share is scaled by its basis coefficient with one table row, then the results are XOR-ed
+    secret = np.zeros(length, dtype=np.uint8)
+    for coefficient, share in zip(lagrange_coefficients(points), shares):
+        secret ^= MUL_TABLE[coefficient][as_array(share.data)]
+    return secret.tobytes()
+
+
+if __name__ == "__main__":
+    secret = os.urandom(100 * 1024 * 1024)
+
+    start = time.perf_counter()
+    parts = split(secret, 3, 5)
+    elapsed = time.perf_counter() - start
+    print(f"Split 100 MB into 5 shares (threshold 3) in {elapsed:.2f} s")
+
+    start = time.perf_counter()
+    recovered = combine([parts[4], parts[1], parts[2]])
+    elapsed = time.perf_counter() - start
+    print(f"Combined 3 shares in {elapsed:.2f} s, secret recovered: {recovered == secret}")
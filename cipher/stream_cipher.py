@@ -0,0 +1,146 @@
+import argparse
+import sys
+
+from . import instrument
+from .caesar import caesar_cipher
+
+# Number of characters read from the input per chunk
+CHUNK_SIZE = 1 << 20
+
+
+# Function that rejects chunk sizes that would stop a stream early (0) or read it all at once (negative)
+def check_chunk_size(chunk_size):
+    if chunk_size < 1:
+        raise ValueError(f"chunk size must be a positive number of characters, got {chunk_size}")
+
+
+# Function that parses a --chunk-size value, which must be a positive integer
+def positive_int(text):
+    try:
+        value = int(text)
+    except ValueError:
+        value = 0
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {text!r}")
+    return value
+
+
+# Function that converts a Caesar key line into a shift value
+def caesar_shift_from_key(key_text, key_rule="first"):
+    if not key_text:
+        raise ValueError("missing key line")
+
+    # Sum of letter positions modulo 26 (part B)
+    if key_rule == "sum":
+        return sum(ord(c) - ord('a') for c in key_text.lower()) % 26
+
+    # Only the first letter of the key (parts C and D)
+    return ord(key_text[0].lower()) - ord('a')
+
+
+# Function that encrypts/decrypts a Caesar stream chunk by chunk; non-letters are copied through unchanged
+def stream_caesar_text(infile, outfile, shift_value, mode="encrypt", chunk_size=CHUNK_SIZE):
+    check_chunk_size(chunk_size)
+    while True:
+        with instrument.stage("caesar.read"):
+            chunk = infile.read(chunk_size)
+        if not chunk:
+            break
+        instrument.count("caesar.chars", len(chunk))
+        with instrument.stage("caesar.translate"):
+            chunk = caesar_cipher(chunk, shift_value, mode=mode)
+        with instrument.stage("caesar.write"):
+            outfile.write(chunk)
+
+
+# Function that encrypts/decrypts the body of a Caesar input file chunk by chunk
+def stream_caesar(infile, outfile, mode="encrypt", key_rule="first", chunk_size=CHUNK_SIZE):
+    key_text = infile.readline().strip()  # First line is the key
+    stream_caesar_text(infile, outfile, caesar_shift_from_key(key_text, key_rule), mode, chunk_size)
+
+
+# Function that encrypts/decrypts a Hill stream chunk by chunk with the given key string
+def stream_hill_text(infile, outfile, key_string, mode="encrypt", chunk_size=CHUNK_SIZE):
+    check_chunk_size(chunk_size)
+
+    # NumPy and the Hill code are only loaded when a Hill stream is actually run
+    import numpy as np
+
+    from .hill import inverse_key, key_material, pad_numbers, transform_blocks
+    from .letter_codec import numbers_to_text, text_to_numbers
+
+    key_matrix = key_material(key_string).matrix
+    block_size = key_matrix.shape[0]
+    matrix = key_matrix if mode == "encrypt" else inverse_key(key_string)
+
+    # Letters of a partial block left over at the end of the previous chunk
+    carry = np.zeros(0, dtype=np.uint8)
+    while True:
+        with instrument.stage("hill.read"):
+            chunk = infile.read(chunk_size)
+        if not chunk:
+            break
+        instrument.count("hill.chars", len(chunk))
+
+        with instrument.stage("hill.text_to_numbers"):
+            numbers = np.concatenate([carry, text_to_numbers(chunk)[0]])
+        usable = len(numbers) - len(numbers) % block_size
+        carry = numbers[usable:]
+        transformed = transform_blocks(numbers[:usable], matrix)
+        with instrument.stage("hill.numbers_to_text"):
+            text = numbers_to_text(transformed)
+        with instrument.stage("hill.write"):
+            outfile.write(text)
+
+    if len(carry):
+        if mode != "encrypt":
+            raise ValueError(f"Ciphertext length is not a multiple of the block size ({block_size}).")
+
+        # Pad the final block (with 'X') like encrypt does
+        outfile.write(numbers_to_text(transform_blocks(pad_numbers(carry, block_size), matrix)))
+
+
+# Function that encrypts/decrypts the body of a Hill input file chunk by chunk
+def stream_hill(infile, outfile, mode="encrypt", chunk_size=CHUNK_SIZE):
+    key_string = infile.readline().strip()  # First line is the key
+    if not key_string:
+        raise ValueError("missing key line")
+    stream_hill_text(infile, outfile, key_string, mode, chunk_size)
+
+
+# Function that opens a path for streaming, treating "-" as stdin/stdout
+def open_stream(path, mode):
+    if path == "-":
+        return sys.stdin if mode == "r" else sys.stdout
+    return open(path, mode, encoding="utf-8", newline="")
+
+
+# Function that parses command-line arguments and runs the requested stream
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream a Caesar or Hill input file through the cipher in chunks.")
+    parser.add_argument("cipher", choices=["caesar", "hill"])
+    parser.add_argument("mode", choices=["encrypt", "decrypt"])
+    parser.add_argument("input", help="input file whose first line is the key ('-' for stdin)")
+    parser.add_argument("output", help="output file ('-' for stdout)")
+    parser.add_argument("--key-rule", choices=["first", "sum"], default="first",
+                        help="how a Caesar key line becomes a shift (default: first letter)")
+    parser.add_argument("--chunk-size", type=positive_int, default=CHUNK_SIZE, help="characters read per chunk")
+    instrument.add_arguments(parser)
+    args = parser.parse_args(argv)
+
+    infile = open_stream(args.input, "r")
+    outfile = open_stream(args.output, "w")
+    try:
+        if args.cipher == "caesar":
+            instrument.run_with_options(args, stream_caesar, infile, outfile, args.mode, args.key_rule, args.chunk_size)
+        else:
+            instrument.run_with_options(args, stream_hill, infile, outfile, args.mode, args.chunk_size)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+
+
+if __name__ == "__main__":
+    main()